@@ -8,7 +8,6 @@ from selenium.webdriver.common.by import By
 from pathlib import Path
 from typing import List, Dict, Any
 from tqdm import tqdm
-from datetime import datetime
 from selenium.webdriver.remote.webelement import WebElement
 from .SavageScraper import SavageScraper, run_multiprocess_scraper
 import json
@@ -17,6 +16,44 @@ import json
 class N1N3Scraper(SavageScraper):
     """Scraper for extracting N1, N2, and N3 level categories"""
     
+    # Locators used when walking a category element
+    _CSS_DIV = (By.CSS_SELECTOR, "div")
+    _CSS_A = (By.CSS_SELECTOR, "a")
+    _CSS_LI = (By.CSS_SELECTOR, "li")
+    _XPATH_SECTION = (By.XPATH, "./ancestor::section[1]")
+    _XPATH_CHILD_DIV = (By.XPATH, "./div")
+    
+    # Returns the N2N3 menu ids and [[N1_name, N2_name, N3_name, N3_url], ...] rows
+    # for the given N2N3 containers and N1 elements
+    _EXTRACT_CATEGORIES_JS = """
+        const menuIds = arguments[0].map(el => el.getAttribute('data-menu-id'));
+        const containers = new Map();
+        arguments[0].forEach((el, i) => {
+            if (menuIds[i]) {
+                containers.set(menuIds[i], el);
+            }
+        });
+        const rows = [];
+        for (const n1 of arguments[1]) {
+            const n1Id = n1.getAttribute('data-menu-id');
+            const n1Div = n1.querySelector('div');
+            const container = n1Id ? containers.get(n1Id) : null;
+            if (!container || !n1Div) {
+                continue;
+            }
+            for (const li of container.querySelectorAll('li')) {
+                const a = li.querySelector('a');
+                const section = li.closest('section');
+                const n2Div = section ? section.querySelector(':scope > div') : null;
+                if (!a || !n2Div) {
+                    continue;
+                }
+                rows.push([n1Div.innerHTML, n2Div.innerHTML, a.innerHTML, a.href]);
+            }
+        }
+        return {menuIds: menuIds, rows: rows};
+    """
+    
     def _get_progress_tracking_key(self) -> str:
         """Get the key used for N1-N3 categories progress tracking"""
         # N1N3 scraper doesn't process individual items with URLs, 
@@ -52,26 +89,25 @@ class N1N3Scraper(SavageScraper):
         # We need to extract all N2/N3 subcategories for this N1
         try:
             N1_id = element.get_attribute('data-menu-id')
-            N1_name = element.find_element(By.CSS_SELECTOR, "div").get_attribute("innerHTML")
+            N1_name = element.find_element(*self._CSS_DIV).get_attribute("innerHTML")
             
-            if hasattr(self, 'logger'):
-                self.logger.info(f"Processing N1 category: {N1_name}")
+            self.logger.debug(f"Processing N1 category: {N1_name}")
             
             # Find corresponding N2N3 subcategories using the lookup dictionary
             if hasattr(self, '_N2_N3_lookup') and N1_id in self._N2_N3_lookup:
                 N1_subcategories = self._N2_N3_lookup[N1_id]
                 
-                li_elements = N1_subcategories.find_elements(By.XPATH, ".//li")
+                li_elements = N1_subcategories.find_elements(*self._CSS_LI)
                 results = []
                 
                 for li_element in li_elements:
                     try:
-                        a_element = li_element.find_element(By.TAG_NAME, "a")
+                        a_element = li_element.find_element(*self._CSS_A)
                         N3_url = a_element.get_attribute("href")
                         N3_name = a_element.get_attribute("innerHTML")
 
-                        parent_section = li_element.find_element(By.XPATH, "./ancestor::section[1]")
-                        N2_name = parent_section.find_element(By.XPATH, "./div").get_attribute("innerHTML")
+                        parent_section = li_element.find_element(*self._XPATH_SECTION)
+                        N2_name = parent_section.find_element(*self._XPATH_CHILD_DIV).get_attribute("innerHTML")
 
                         result_item = {
                             "N1": N1_name,
@@ -79,28 +115,23 @@ class N1N3Scraper(SavageScraper):
                             "N3": N3_name,
                             "N3_url": N3_url,
                             'lower_price': "0",
-                            'higher_price': "99999",
-                            'scraped_at': datetime.now().isoformat(),
-                            'process_id': self.process_id
+                            'higher_price': "99999"
                         }
                         results.append(result_item)
                             
                     except Exception as e:
-                        if hasattr(self, 'logger'):
-                            self.logger.warning(f"Error processing li element: {e}")
+                        self.logger.warning(f"Error processing li element: {e}")
                         continue
                 
                 # Store results for this N1 category to be returned
                 self._current_n1_results = results
                 return {"processed": True, "count": len(results)}
             else:
-                if hasattr(self, 'logger'):
-                    self.logger.warning(f"No subcategories found for {N1_name}")
+                self.logger.warning(f"No subcategories found for {N1_name}")
                 return {"processed": True, "count": 0}
                 
         except Exception as e:
-            if hasattr(self, 'logger'):
-                self.logger.error(f"Error processing N1 element: {e}")
+            self.logger.error(f"Error processing N1 element: {e}")
             return None
     
     def _create_empty_result(self, item: Dict[str, Any]) -> Dict[str, Any]:
@@ -111,9 +142,7 @@ class N1N3Scraper(SavageScraper):
             "N3": "",
             "N3_url": "",
             'lower_price': "0",
-            'higher_price': "99999",
-            'scraped_at': datetime.now().isoformat(),
-            'process_id': self.process_id
+            'higher_price': "99999"
         }
     
     def _get_resume_key(self) -> str:
@@ -126,8 +155,7 @@ class N1N3Scraper(SavageScraper):
         try:
             # Navigate to the main page
             if not self._navigate_to_url(self.base_url):
-                if hasattr(self, 'logger'):
-                    self.logger.error(f"Failed to navigate to {self.base_url}")
+                self.logger.error(f"Failed to navigate to {self.base_url}")
                 return []
             
             # Open hamburger menu
@@ -138,23 +166,19 @@ class N1N3Scraper(SavageScraper):
             return self._extract_all_categories()
             
         except Exception as e:
-            if hasattr(self, 'logger'):
-                self.logger.error(f"Error in N1N3 processing: {e}")
+            self.logger.error(f"Error in N1N3 processing: {e}")
             return []
     
     def _open_hamburger_menu(self) -> bool:
         """Open hamburger menu"""
-        if hasattr(self, 'logger'):
-            self.logger.info("Opening hamburger menu")
+        self.logger.info("Opening hamburger menu")
         
         for selector in self.selectors["hamburger_menu"]:
             if self._click_element(selector):
-                if hasattr(self, 'logger'):
-                    self.logger.info("Hamburger menu opened successfully")
+                self.logger.info("Hamburger menu opened successfully")
                 return True
         
-        if hasattr(self, 'logger'):
-            self.logger.error("Failed to open hamburger menu")
+        self.logger.error("Failed to open hamburger menu")
         return False
     
     def _extract_all_categories(self) -> List[Dict[str, Any]]:
@@ -163,73 +187,45 @@ class N1N3Scraper(SavageScraper):
         N2_N3_elements = self._find_elements("N2N3")
         
         if not N1_elements or not N2_N3_elements:
-            if hasattr(self, 'logger'):
-                self.logger.warning("No categories found")
+            self.logger.warning("No categories found")
             return []
         
-        if hasattr(self, 'logger'):
-            self.logger.info(f"Found {len(N1_elements)} N1 categories")
+        self.logger.info(f"Found {len(N1_elements)} N1 categories")
         
-        # Build lookup dictionary for N2N3 elements
-        self._N2_N3_lookup = {}
-        for N2_N3_element in N2_N3_elements:
-            menu_id = N2_N3_element.get_attribute('data-menu-id')
-            if menu_id:
-                self._N2_N3_lookup[menu_id] = N2_N3_element
+        # Walk every N1 -> section -> li in the browser and get the menu ids and all rows back in a single call
+        extracted = self.driver.execute_script(
+            self._EXTRACT_CATEGORIES_JS,
+            N2_N3_elements,
+            N1_elements
+        )
+        rows = extracted["rows"]
         
-        # Process each N1 category and collect all results
-        all_results = []
+        # Build lookup dictionary for N2N3 elements from the menu ids read by the script
+        self._N2_N3_lookup = {
+            menu_id: N2_N3_element
+            for menu_id, N2_N3_element in zip(extracted["menuIds"], N2_N3_elements)
+            if menu_id
+        }
         
-        for N1_element in N1_elements:
-            try:
-                N1_id = N1_element.get_attribute('data-menu-id')
-                N1_name = N1_element.find_element(By.CSS_SELECTOR, "div").get_attribute("innerHTML")
-                
-                # Find corresponding N2N3 subcategories
-                if N1_id in self._N2_N3_lookup:
-                    N1_subcategories = self._N2_N3_lookup[N1_id]
-                    
-                    li_elements = N1_subcategories.find_elements(By.XPATH, ".//li")
-                    
-                    if hasattr(self, 'logger'):
-                        self.logger.info(f"Processing {len(li_elements)} subcategories for {N1_name}")
-                    
-                    for li_element in li_elements:
-                        try:
-                            a_element = li_element.find_element(By.TAG_NAME, "a")
-                            N3_url = a_element.get_attribute("href")
-                            N3_name = a_element.get_attribute("innerHTML")
-
-                            parent_section = li_element.find_element(By.XPATH, "./ancestor::section[1]")
-                            N2_name = parent_section.find_element(By.XPATH, "./div").get_attribute("innerHTML")
-
-                            result_item = {
-                                "N1": N1_name,
-                                "N2": N2_name,
-                                "N3": N3_name,
-                                "N3_url": N3_url,
-                                'lower_price': "0",
-                                'higher_price': "99999",
-                                'scraped_at': datetime.now().isoformat(),
-                                'process_id': self.process_id
-                            }
-                            all_results.append(result_item)
-                                
-                        except Exception as e:
-                            if hasattr(self, 'logger'):
-                                self.logger.warning(f"Error processing li element: {e}")
-                            continue
-                else:
-                    if hasattr(self, 'logger'):
-                        self.logger.warning(f"No subcategories found for {N1_name}")
-                        
-            except Exception as e:
-                if hasattr(self, 'logger'):
-                    self.logger.error(f"Error processing N1 element: {e}")
-                continue
+        all_results = []
+        # Template keeps the output column order; only the N1-N3 fields change per row
+        template = {
+            "N1": "",
+            "N2": "",
+            "N3": "",
+            "N3_url": "",
+            'lower_price': "0",
+            'higher_price': "99999"
+        }
+        for N1_name, N2_name, N3_name, N3_url in rows:
+            result_item = template.copy()
+            result_item["N1"] = N1_name
+            result_item["N2"] = N2_name
+            result_item["N3"] = N3_name
+            result_item["N3_url"] = N3_url
+            all_results.append(result_item)
         
-        if hasattr(self, 'logger'):
-            self.logger.info(f"Extracted total of {len(all_results)} N3 categories")
+        self.logger.info(f"Extracted total of {len(all_results)} N3 categories")
         
         return all_results
 
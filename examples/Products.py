@@ -3,20 +3,107 @@
 Products Scraper - Extracts products from product URLs
 """
 
-from selenium.webdriver.common.by import By
 from pathlib import Path
-from typing import List, Dict, Any
-import pandas as pd
+from typing import List, Dict, Any, Optional
+import csv
 import json
-import time
-from datetime import datetime
+import random
+import urllib.request
 from selenium.webdriver.remote.webelement import WebElement
 from .SavageScraper import SavageScraper, run_multiprocess_scraper
 
+try:
+    import lxml.etree
+    import lxml.html
+    from lxml.cssselect import CSSSelector
+except ImportError:  # lxml/cssselect are optional: without them every product goes through Selenium
+    lxml = None
+
 
 class ProductsScraper(SavageScraper):
     """Scraper for extracting products from product URLs"""
     
+    # Fetch product pages over plain HTTP and parse them with lxml when possible, Selenium is the fallback
+    HTTP_FAST_PATH = True
+    HTTP_TIMEOUT = 15
+    
+    _PRODUCT_FIELD_SELECTORS = [
+        'product_name',
+        'product_image',
+        'product_rating',
+        'product_price',
+        'product_reviews',
+        'product_seller',
+        'product_sender',
+        'product_sales',
+        'product_tags',
+        'product_metadata1',
+        'product_metadata2',
+        'product_metadata3'
+    ]
+    
+    # Input columns carried over to every output row
+    _ITEM_COLUMNS = (
+        'N1', 'N2', 'N3', 'N4', 'N5', 'N3_url', 'N4_url', 'N5_url',
+        'product_url', 'page', 'position_in_page'
+    )
+    
+    # Empty output row in output column order, _create_empty_result copies it and fills in the item columns
+    _EMPTY_RESULT_SKELETON = dict(
+        dict.fromkeys(('name', 'image', 'rating', 'price', 'reviews', 'seller', 'sender', 'sales'), ""),
+        metadata1="{}",
+        metadata2="{}",
+        metadata3="{}",
+        tags="",
+        **dict.fromkeys(_ITEM_COLUMNS, "")
+    )
+    
+    # Returns a JSON string with the raw text of every product field and the raw [key, value] rows of the metadata
+    # tables; arguments[0] maps selector keys to selector specs. Text is read with textContent, as lxml's
+    # text_content() reads it on the HTTP fast path, and cleaned for both paths by _build_product_data
+    _EXTRACT_PRODUCT_JS = """
+        const specs = arguments[0];
+        const first = key => findFirst(document, specs[key]);
+        const text = el => el ? (el.textContent || '') : '';
+        const tableRows = el => {
+            const rows = [];
+            if (!el) {
+                return rows;
+            }
+            for (const row of el.querySelectorAll('tr')) {
+                const cells = row.querySelectorAll('th, td');
+                if (cells.length >= 2) {
+                    rows.push([text(cells[0]), text(cells[1])]);
+                }
+            }
+            return rows;
+        };
+        const image = first('product_image');
+        return JSON.stringify({
+            name: text(first('product_name')),
+            image: image ? (image.src || image.getAttribute('src') || '') : '',
+            rating: text(first('product_rating')),
+            price: text(first('product_price')),
+            reviews: text(first('product_reviews')),
+            seller: text(first('product_seller')),
+            sender: text(first('product_sender')),
+            sales: text(first('product_sales')),
+            tags: text(first('product_tags')),
+            metadata1: tableRows(first('product_metadata1')),
+            metadata2: tableRows(first('product_metadata2')),
+            metadata3: tableRows(first('product_metadata3'))
+        });
+    """
+    
+    # Text fields of the output row, each cleaned the same way whichever path extracted it
+    _TEXT_FIELDS = ('name', 'rating', 'price', 'reviews', 'seller', 'sender', 'sales', 'tags')
+    _METADATA_FIELDS = ('metadata1', 'metadata2', 'metadata3')
+    
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        # Selectors compiled for lxml per key, used by the HTTP fast path
+        self._tree_selectors = {}
+    
     def _get_progress_tracking_key(self) -> str:
         """Get the key used for products progress tracking"""
         return "product_url"
@@ -63,37 +150,21 @@ class ProductsScraper(SavageScraper):
     
     def _create_empty_result(self, item: Dict[str, Any]) -> Dict[str, Any]:
         """Create an empty result when product extraction fails"""
-        return {
-            "name": "",
-            "image": "",
-            "rating": "",
-            "price": "",
-            "reviews": "",
-            "seller": "",
-            "sender": "",
-            "sales": "",
-            "metadata1": "{}",
-            "metadata2": "{}",
-            "metadata3": "{}",
-            "tags": "",
-            "N1": item["N1"],
-            "N2": item["N2"],
-            "N3": item["N3"],
-            "N4": item["N4"],
-            "N5": item["N5"],
-            "N3_url": item["N3_url"],
-            "N4_url": item["N4_url"],
-            "N5_url": item["N5_url"],
-            "product_url": item["product_url"],
-            "page": item["page"],
-            "position_in_page": item["position_in_page"],
-            'scraped_at': datetime.now().isoformat(),
-            'process_id': self.process_id
-        }
+        result = self._EMPTY_RESULT_SKELETON.copy()
+        result.update({column: item[column] for column in self._ITEM_COLUMNS})
+        return result
     
     def _process_single_item(self, item: Dict[str, Any]) -> List[Dict[str, Any]]:
         """Process a single product URL to extract product details"""
         try:
+            # Try the HTTP fast path first, static product pages don't need a browser
+            if self._http_fast_path_enabled():
+                product_data = self._extract_product_data_http(item)
+                if product_data:
+                    self.logger.debug(f"Successfully processed product over HTTP: {product_data.get('name', '')}")
+                    return [product_data]
+                self.logger.debug("HTTP fast path failed, falling back to Selenium")
+
             # Navigate to the product URL
             if not self._navigate_to_url(item[self.progress_tracking_key]):
                 self.logger.error(f"Failed to navigate to {item[self.progress_tracking_key]}")
@@ -103,13 +174,11 @@ class ProductsScraper(SavageScraper):
             if not self._wait_for_page_ready():
                 self.logger.warning("Product page not ready")
 
-            time.sleep(1)
-
             # Extract product information
             product_data = self._extract_product_data(item)
             
             if product_data:
-                self.logger.info(f"Successfully processed product: {product_data.get('name', '')}")
+                self.logger.debug(f"Successfully processed product: {product_data.get('name', '')}")
                 return [product_data]
             else:
                 self.logger.warning("Failed to extract product data")
@@ -122,50 +191,11 @@ class ProductsScraper(SavageScraper):
     def _extract_product_data(self, item: Dict[str, Any]) -> Dict[str, Any]:
         """Extract all product data from the current page"""
         try:
-            # Find all product elements
-            product_name = self._find_elements("product_name")
-            product_image = self._find_elements("product_image")
-            product_rating = self._find_elements("product_rating")
-            product_price = self._find_elements("product_price")
-            product_reviews = self._find_elements("product_reviews")
-            product_seller = self._find_elements("product_seller")
-            product_sender = self._find_elements("product_sender")
-            product_sales = self._find_elements("product_sales")
-            products_tags = self._find_elements("product_tags")
-            
-            # Extract metadata tables
-            product_metadata1 = self._extract_metadata_table("product_metadata1")
-            product_metadata2 = self._extract_metadata_table("product_metadata2")
-            product_metadata3 = self._extract_metadata_table("product_metadata3")
+            # Resolve every field in the page with a single script call
+            specs = {key: self._selector_specs(key) for key in self._PRODUCT_FIELD_SELECTORS}
+            fields = json.loads(self._execute_page_script(self._EXTRACT_PRODUCT_JS, specs))
 
-            # Build product data
-            product_data = {
-                "name": product_name[0].text.strip() if product_name else "",   
-                "image": product_image[0].get_attribute("src") if product_image else "",
-                "rating": product_rating[0].text.strip() if product_rating else "",
-                "price": self.get_clean_text(product_price[0]) if product_price else "",
-                "reviews": product_reviews[0].text.strip() if product_reviews else "",
-                "seller": product_seller[0].text.strip() if product_seller else "",
-                "sender": product_sender[0].text.strip() if product_sender else "",
-                "sales": self.get_clean_text(product_sales[0]) if product_sales else "",
-                "metadata1": json.dumps(product_metadata1) if product_metadata1 else "{}",
-                "metadata2": json.dumps(product_metadata2) if product_metadata2 else "{}",
-                "metadata3": json.dumps(product_metadata3) if product_metadata3 else "{}",
-                "tags": self.get_clean_text(products_tags[0]) if products_tags else "",
-                "N1": item["N1"],
-                "N2": item["N2"],
-                "N3": item["N3"],
-                "N4": item["N4"],
-                "N5": item["N5"],
-                "N3_url": item["N3_url"],
-                "N4_url": item["N4_url"],
-                "N5_url": item["N5_url"],
-                "product_url": item["product_url"],
-                "page": item["page"],
-                "position_in_page": item["position_in_page"],
-                'scraped_at': datetime.now().isoformat(),
-                'process_id': self.process_id
-            }
+            product_data = self._build_product_data(fields, item)
             
             self.logger.debug(f"Extracted product: {product_data.get('name', '')}")
             return product_data
@@ -174,34 +204,98 @@ class ProductsScraper(SavageScraper):
             self.logger.error(f"Error extracting product data: {e}")
             return None
     
-    def _extract_metadata_table(self, selector_key: str) -> Dict[str, str]:
-        """Extract table data and return as dictionary"""
+    def _build_product_data(self, fields: Dict[str, Any], item: Dict[str, Any]) -> Dict[str, Any]:
+        """Build the output row from the raw extracted fields (metadata fields are lists of [key, value] rows)"""
+        product_data = {field: self._clean_text(fields[field]) for field in self._TEXT_FIELDS}
+        product_data["image"] = fields["image"]
+        for field in self._METADATA_FIELDS:
+            product_data[field] = self._metadata_json(fields[field])
+        product_data.update({column: item[column] for column in self._ITEM_COLUMNS})
+        # Same column order as the empty rows
+        return {column: product_data[column] for column in self._EMPTY_RESULT_SKELETON}
+    
+    def _metadata_json(self, rows: List[List[str]]) -> str:
+        """Serialize the raw [key, value] rows of a metadata table, keeping the rows with both cells non-empty once cleaned"""
+        data = {}
+        for key, value in rows:
+            key = self._clean_text(key)
+            value = self._clean_text(value)
+            if key and value:
+                data[key] = value
+        return json.dumps(data, ensure_ascii=False)
+    
+    def _http_fast_path_enabled(self) -> bool:
+        """Check if products can be fetched without the browser"""
+        # Translated pages only exist inside Chrome, so translation forces the Selenium path
+        return self.HTTP_FAST_PATH and lxml is not None and not self.translation
+    
+    def _extract_product_data_http(self, item: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """Fetch the product page over HTTP and extract the product data with lxml"""
         try:
-            table_elements = self._find_elements(selector_key)
-            if not table_elements:
-                return {}
-            
-            table_element = table_elements[0]
-            data = {}
-            
-            rows = table_element.find_elements(By.TAG_NAME, "tr")
-            
-            for row in rows:
-                try:
-                    cells = row.find_elements(By.CSS_SELECTOR, "th, td")
-                    if len(cells) >= 2:
-                        key = cells[0].text.strip()
-                        value = cells[1].text.strip()
-                        if key and value:
-                            data[key] = value
-                except Exception:
-                    continue
-            
-            return data
-            
+            request = urllib.request.Request(item["product_url"], headers={
+                "User-Agent": random.choice(self.USER_AGENTS),
+                "Accept-Language": "en-US,en;q=0.9"
+            })
+            with urllib.request.urlopen(request, timeout=self.HTTP_TIMEOUT) as response:
+                tree = lxml.html.fromstring(response.read(), base_url=response.geturl())
+
+            # The page ready marker is missing on captcha/JS-only pages, Selenium has to handle those
+            if self._find_in_tree(tree, self.page_ready_selector) is None:
+                return None
+
+            elements = {key: self._find_in_tree(tree, key) for key in self._PRODUCT_FIELD_SELECTORS}
+            # Raw text as _EXTRACT_PRODUCT_JS returns it, _build_product_data cleans both paths alike
+            fields = {field: self._tree_text(elements[f'product_{field}']) for field in self._TEXT_FIELDS}
+            image = elements['product_image']
+            fields["image"] = image.get('src', '') if image is not None else ""
+            for field in self._METADATA_FIELDS:
+                fields[field] = self._metadata_rows_from_tree(elements[f'product_{field}'])
+            return self._build_product_data(fields, item)
+
         except Exception as e:
-            self.logger.warning(f"Error extracting metadata table {selector_key}: {e}")
-            return {}
+            self.logger.debug(f"HTTP extraction failed for {item['product_url']}: {e}")
+            return None
+    
+    def _find_in_tree(self, tree, selector_key: str):
+        """Find the first element matching the configured selectors in an lxml tree"""
+        for compiled in self._compiled_tree_selectors(selector_key):
+            try:
+                found = [el for el in compiled(tree) if isinstance(el, lxml.html.HtmlElement)]
+            except Exception:
+                continue
+            if found:
+                return found[0]
+        return None
+    
+    def _compiled_tree_selectors(self, selector_key: str) -> List[Any]:
+        """Get the configured selectors for a key compiled for lxml, compiling them on first use"""
+        compiled = self._tree_selectors.get(selector_key)
+        if compiled is None:
+            compiled = []
+            for by_type, selector in self._selector_specs(selector_key):
+                try:
+                    compiled.append(lxml.etree.XPath(selector) if by_type == 'xpath' else CSSSelector(selector))
+                except Exception as e:
+                    self.logger.warning(f"Invalid selector for lxml '{selector}': {e}")
+            self._tree_selectors[selector_key] = compiled
+        return compiled
+    
+    @staticmethod
+    def _tree_text(element) -> str:
+        """Raw text of an lxml element, the textContent the in-page script reads"""
+        return element.text_content() if element is not None else ""
+    
+    def _metadata_rows_from_tree(self, table_element) -> List[List[str]]:
+        """Raw [key, value] rows of a metadata table in an lxml tree, as the in-page script returns them"""
+        if table_element is None:
+            return []
+        
+        rows = []
+        for row in table_element.iter('tr'):
+            cells = row.xpath('.//th | .//td')
+            if len(cells) >= 2:
+                rows.append([self._tree_text(cells[0]), self._tree_text(cells[1])])
+        return rows
 
 
 def load_product_urls(output_dir: Path, key: str) -> List[Dict[str, Any]]:
@@ -213,40 +307,36 @@ def load_product_urls(output_dir: Path, key: str) -> List[Dict[str, Any]]:
             print(f"Input file not found: {input_file}")
             return []
         
-        input_data = pd.read_csv(input_file, encoding='utf-8')
-        
-        # Check required columns
         required_columns = ['N1', 'N2', 'N3', 'N4', 'N5', 'product_url', 'N3_url', 'N4_url', 'N5_url', 'page', 'position_in_page']
-        missing_columns = [col for col in required_columns if col not in input_data.columns]
-        if missing_columns:
-            print(f"Input file is missing required columns: {missing_columns}")
-            return []
         
-        if input_data.empty:
+        with open(input_file, 'r', encoding='utf-8', newline='') as f:
+            reader = csv.DictReader(f, restval='')
+            fieldnames = reader.fieldnames or []
+            
+            # Check required columns
+            missing_columns = [col for col in required_columns if col not in fieldnames]
+            if missing_columns:
+                print(f"Input file is missing required columns: {missing_columns}")
+                return []
+            
+            # Only keep the columns the scraper needs
+            columns = [col for col in fieldnames if col in required_columns]
+            rows = [{col: row[col] for col in columns} for row in reader]
+        
+        if not rows:
             print("Input file is empty, no products to process")
             return []
         
-        print(f"Total rows in input file: {len(input_data)}")
-        
-        # Filter out rows where product_url is empty or null
-        before_filter = len(input_data)
-        input_data = input_data.dropna(subset=['product_url'])
-        input_data = input_data[input_data['product_url'].str.strip() != '']
-        after_filter = len(input_data)
-        
-        if before_filter != after_filter:
-            print(f"Filtered out {before_filter - after_filter} rows with empty product_url")
+        print(f"Total rows in input file: {len(rows)}")
         
-        if input_data.empty:
-            print("No valid product URLs found in input file after filtering")
-            return []
+        # Filter out rows where product_url is empty
+        products = [row for row in rows if row['product_url'].strip()]
         
-        # Convert DataFrame to list of dictionaries and handle NaN values
-        input_data = input_data.fillna('')
-        products = input_data.to_dict(orient='records')
+        if len(rows) != len(products):
+            print(f"Filtered out {len(rows) - len(products)} rows with empty product_url")
         
         if not products:
-            print("Input file has no valid data")
+            print("No valid product URLs found in input file after filtering")
             return []
         
         print(f"Loaded {len(products)} product URLs to process")
@@ -4,18 +4,181 @@ Products URLs Scraper - Extracts products URLs from category pages
 """
 
 from pathlib import Path
-from typing import List, Dict, Any
+from typing import List, Dict, Any, NamedTuple, Optional, Tuple
 import pandas as pd
 import json
 import time
-from datetime import datetime
+import re
+from urllib.parse import urlparse, urlunparse, parse_qsl, urlencode
 from selenium.webdriver.remote.webelement import WebElement
-from .SavageScraper import SavageScraper, run_multiprocess_scraper
+from .SavageScraper import SavageScraper, run_multiprocess_scraper, default_num_processes
+
+
+# Patterns used to parse listing prices and review counts. Inside a price, a space is only taken as a thousands
+# separator when it is a non-breaking or thin one followed by a group of three digits, so two adjacent prices
+# ("12,99 15,00") are never read as one
+_HTML_TAG_PATTERN = re.compile(r'<[^>]+>')
+_SPACE_SEPARATORS = '\u00a0\u2009\u202f'
+_PRICE_PATTERN = re.compile(rf'\d(?:(?:[\d.,]|[{_SPACE_SEPARATORS}](?=\d{{3}}\b))*\d)?')
+_SPACE_SEPARATOR_PATTERN = re.compile(f'[{_SPACE_SEPARATORS}]')
+_DECIMAL_COMMA_PATTERN = re.compile(r',\d{1,2}$')
+_DOT_GROUPING_PATTERN = re.compile(r'\d{1,3}(?:\.\d{3})+')
+# A review count is the only number of its element, any space before a group of three digits is a separator
+_REVIEWS_PATTERN = re.compile(r'\d(?:[\d.,]|\s(?=\d{3}\b))*')
+
+
+def _parse_price(raw_price: Any) -> float:
+    """Parse the first number of a listing price, 0 when there is none.
+    "1.234,56" and "12,5" use a decimal comma, "1,234.56" and "1.234" use grouping separators"""
+    match = _PRICE_PATTERN.search(_HTML_TAG_PATTERN.sub('', str(raw_price)))
+    if not match:
+        return 0
+    number = _SPACE_SEPARATOR_PATTERN.sub('', match.group())
+    if _DECIMAL_COMMA_PATTERN.search(number) or _DOT_GROUPING_PATTERN.fullmatch(number):
+        number = number.replace('.', '').replace(',', '.')
+    else:
+        number = number.replace(',', '')
+    try:
+        return float(number)
+    except ValueError:
+        return 0
+
+
+def _parse_review_count(raw_reviews: Any) -> int:
+    """Parse the first number of a review count, 0 when there is none. Counts are whole, every separator is dropped"""
+    match = _REVIEWS_PATTERN.search(str(raw_reviews))
+    if not match:
+        return 0
+    return int(re.sub(r'\D', '', match.group()))
+
+
+def _merge_filter_urls(urls: List[str]) -> str:
+    """Merge the query parameters of several filter links into the first one, combining their 'rh' refinements"""
+    base = urlparse(urls[0])
+    params = dict(parse_qsl(base.query, keep_blank_values=True))
+    refinements = [token for token in params.get("rh", "").split(",") if token]
+    
+    for url in urls[1:]:
+        for name, value in parse_qsl(urlparse(url).query, keep_blank_values=True):
+            if name == "rh":
+                refinements.extend(token for token in value.split(",") if token and token not in refinements)
+            else:
+                params.setdefault(name, value)
+    
+    if refinements:
+        params["rh"] = ",".join(refinements)
+    return urlunparse(base._replace(query=urlencode(params, safe=":,")))
+
+
+def _set_query_params(url: str, new_params: Dict[str, Any]) -> str:
+    """Set query parameters on a URL, replacing existing values"""
+    parts = urlparse(url)
+    params = dict(parse_qsl(parts.query, keep_blank_values=True))
+    params.update(new_params)
+    return urlunparse(parts._replace(query=urlencode(params, safe=":,")))
+
+
+class ProductRow(NamedTuple):
+    """One product found on a listing page, in output column order"""
+    N1: str
+    N2: str
+    N3: str
+    N4: str
+    N5: str
+    product_url: str
+    product_reviews: Any
+    product_price: Any
+    N3_url: str
+    N4_url: str
+    N5_url: str
+    page: int
+    position_in_page: int
 
 
 class MainProductsURLSScraper(SavageScraper):
     """Scraper for extracting products URLs from N5 pages"""
     
+    # Fetch pages 2..N with fetch() inside the browser instead of navigating to each of them
+    FETCH_REMAINING_PAGES = True
+    FETCH_CONCURRENCY = 4
+    PAGE_FETCH_TIMEOUT = 60
+    
+    # Pages are streamed as they are parsed, a category only counts as done once all its pages were sent
+    RESUME_FROM_PROCESSED_KEYS = True
+    
+    # Defines productRows(root, containerSpecs, urlSpecs, priceSpecs, reviewsSpecs), returning
+    # [[product_url, price_html, reviews_text], ...] for every product container under root
+    _PRODUCT_ROWS_JS = """
+        const rawText = el => {
+            if (!el) {
+                return '';
+            }
+            for (const value of [el.innerText, el.textContent, el.innerHTML]) {
+                if (value && value.trim()) {
+                    return value;
+                }
+            }
+            return '';
+        };
+        function productRows(root, containerSpecs, urlSpecs, priceSpecs, reviewsSpecs) {
+            return findAll(root, containerSpecs).map(container => {
+                const url = findFirst(container, urlSpecs);
+                const price = findFirst(container, priceSpecs);
+                const reviews = findFirst(container, reviewsSpecs);
+                return [
+                    url ? url.href || null : null,
+                    price ? price.innerHTML : '',
+                    rawText(reviews)
+                ];
+            });
+        }
+    """
+    
+    # Product rows of the current page; arguments are the selector specs for the container, url, price and reviews keys
+    _EXTRACT_PRODUCTS_JS = _PRODUCT_ROWS_JS + """
+        return productRows(document, ...arguments);
+    """
+    
+    # Fetches arguments[0] (page URLs) with at most arguments[5] requests in flight and parses them with DOMParser;
+    # calls back with the product rows of each page, null for pages that could not be fetched
+    _FETCH_PRODUCTS_JS = _PRODUCT_ROWS_JS + """
+        const callback = arguments[arguments.length - 1];
+        const [urls, containerSpecs, urlSpecs, priceSpecs, reviewsSpecs, concurrency] = arguments;
+        const results = urls.map(() => null);
+        let next = 0;
+        async function worker() {
+            while (next < urls.length) {
+                const i = next++;
+                try {
+                    const response = await fetch(urls[i], {credentials: 'include'});
+                    if (response.ok) {
+                        const doc = new DOMParser().parseFromString(await response.text(), 'text/html');
+                        results[i] = productRows(doc, containerSpecs, urlSpecs, priceSpecs, reviewsSpecs);
+                    }
+                } catch (e) {
+                    results[i] = null;
+                }
+            }
+        }
+        const workers = [];
+        for (let i = 0; i < Math.min(concurrency, urls.length); i++) {
+            workers.push(worker());
+        }
+        Promise.all(workers).then(() => callback(results));
+    """
+    
+    # Highest page number shown in the pagination bar; arguments[0] is the pagination item selector specs
+    _TOTAL_PAGES_JS = """
+        let total = 0;
+        for (const el of findAll(document, arguments[0])) {
+            const number = parseInt((el.textContent || '').trim(), 10);
+            if (!isNaN(number) && number > total) {
+                total = number;
+            }
+        }
+        return total;
+    """
+    
     def __init__(self, config_dir=None, output_dir=None, logs_dir=None,error_pages_dir=None, 
                  is_headless=False, translation=False, process_id=None,
                  apply_four_stars_filter=True, apply_shipping_by_amazon_filter=True, 
@@ -83,75 +246,201 @@ class MainProductsURLSScraper(SavageScraper):
             "N5_url": item["N5_url"],
             "product_url": "",
             "page": 1,
-            "position_in_page": 1,
-            'scraped_at': datetime.now().isoformat(),
-            'process_id': self.process_id
+            "position_in_page": 1
         }
     
     def _process_single_item(self, item: Dict[str, Any]) -> List[Dict[str, Any]]:
-        """Process a single N5 category to extract products across multiple pages"""
-        all_products = []
+        """Process a single N5 category to extract products across multiple pages, streaming each page's products.
+        Raises when a page cannot be reached, so the category is recorded as an error and retried on resume.
+        The error is logged by _process_batch_item"""
+        total_products = 0
         page = 1
         
-        try:
-            # Navigate to the N5 category page
-            if not self._navigate_to_url(item[self.progress_tracking_key]):
-                self.logger.error(f"Failed to navigate to {item[self.progress_tracking_key]}")
-                return []
+        # Navigate to the N5 category page
+        if not self._navigate_to_url(item[self.progress_tracking_key]):
+            raise RuntimeError(f"Failed to navigate to {item[self.progress_tracking_key]}")
 
-            # Apply filters
-            if not self._apply_filters(item):
-                self.logger.error("Failed to apply filters")
-                return []
+        # Apply filters
+        if not self._apply_filters(item):
+            raise RuntimeError("Failed to apply filters")
 
-            # Process pages
-            while page <= self.max_pages:
-                self.logger.info(f"Processing page {page} for: {item['N1']} > {item['N2']} > {item['N3']} > {item['N4']} > {item['N5']}")
-                
-                # Extract products from current page
-                page_products = self._extract_products_from_page(item, page)
+        # Process pages
+        while page <= self.max_pages:
+            self.logger.debug(f"Processing page {page} for: {item['N1']} > {item['N2']} > {item['N3']} > {item['N4']} > {item['N5']}")
+            
+            # Extract products from current page
+            page_products = self._extract_products_from_page(item, page)
+            
+            if not page_products:
+                self.logger.warning(f"No products found on page {page}")
+                break
+            
+            # Send this page to the output writer now instead of holding every page in memory
+            self._emit_results(self._parse_numeric_fields(page_products))
+            total_products += len(page_products)
+            self.logger.debug(f"Extracted {len(page_products)} products from page {page}")
+            
+            # Fetch the remaining pages from the first one, then continue by navigation from the first page that failed
+            if page == 1 and self.FETCH_REMAINING_PAGES:
+                fetched_pages, fetched_products, resume_url = self._fetch_remaining_pages(item)
+                page += fetched_pages
+                total_products += fetched_products
+                if fetched_pages:
+                    if not resume_url:
+                        break
+                    if not self._navigate_to_url(resume_url):
+                        raise RuntimeError(f"Failed to navigate to page {page + 1}")
+                    page += 1
+                    continue
+            
+            # Check for next page
+            next_page_url = self._next_page_url()
+            if not next_page_url:
+                self.logger.debug(f"No next page found after page {page}")
+                break
+            
+            # Navigate to next page
+            if not self._navigate_to_url(next_page_url):
+                raise RuntimeError(f"Failed to navigate to page {page + 1}")
                 
+            page += 1
+
+        if not total_products:
+            # Mark as processed so a resumed run skips it
+            self.logger.warning(f"No products extracted for {item[self.progress_tracking_key]}")
+            return self._empty_results(item)
+        
+        # Every page was sent, a resumed run can skip this category from now on
+        self._mark_processed(item)
+        self.logger.info(f"Successfully processed {total_products} total products from {page} pages")
+        return []
+    
+    def _fetch_remaining_pages(self, item: Dict[str, Any]) -> Tuple[int, int, Optional[str]]:
+        """Fetch and emit pages 2..N from page 1 without navigating.
+        Returns the number of pages and products emitted, and the URL of the first page left to navigate to (None when done)"""
+        page_urls = []
+        fetched_pages = 0
+        fetched_products = 0
+        try:
+            next_page_url = self._next_page_url()
+            if not next_page_url:
+                return 0, 0, None
+            
+            total_pages = self._execute_page_script(self._TOTAL_PAGES_JS, self._selector_specs("products_pagination_item"))
+            last_page = min(total_pages or 0, self.max_pages)
+            if last_page < 2:
+                return 0, 0, next_page_url
+            
+            page_urls = [_set_query_params(next_page_url, {"page": page}) for page in range(2, last_page + 1)]
+            self.logger.info(f"Fetching pages 2-{last_page} in the browser")
+            
+            self.driver.set_script_timeout(self.PAGE_FETCH_TIMEOUT)
+            pages_rows = self._execute_async_page_script(
+                self._FETCH_PRODUCTS_JS,
+                page_urls,
+                self._selector_specs("products_container"),
+                self._selector_specs("products_url"),
+                self._selector_specs("products_price"),
+                self._selector_specs("products_reviews"),
+                self.FETCH_CONCURRENCY
+            )
+            
+            for index, rows in enumerate(pages_rows):
+                page = index + 2
+                page_products = self._products_from_rows(rows, item, page) if rows else []
                 if not page_products:
-                    self.logger.warning(f"No products found on page {page}")
-                    break
-                
-                all_products.extend(page_products)
-                self.logger.info(f"Extracted {len(page_products)} products from page {page}")
+                    # Not parsable outside the browser (bot check, missing markup): navigate from here
+                    self.logger.warning(f"Could not fetch page {page}, continuing by navigation")
+                    return index, fetched_products, page_urls[index]
                 
-                # Check for next page
-                if not self._has_next_page():
-                    self.logger.info(f"No next page found after page {page}")
-                    break
-                
-                # Navigate to next page
-                if not self._navigate_to_next_page():
-                    self.logger.error(f"Failed to navigate to page {page + 1}")
-                    break
-                    
-                page += 1
-
-            if not all_products:
-                # Create empty result to mark as processed
-                empty_result = self._create_empty_result(item)
-                all_products.append(empty_result)
-                self.logger.warning(f"No products extracted for {item[self.progress_tracking_key]}")
-            else:
-                self.logger.info(f"Successfully processed {len(all_products)} total products from {page} pages")
+                self._emit_results(self._parse_numeric_fields(page_products))
+                fetched_pages += 1
+                fetched_products += len(page_products)
+                self.logger.debug(f"Extracted {len(page_products)} products from fetched page {page}")
             
-            return all_products
+            return len(page_urls), fetched_products, None
         
         except Exception as e:
-            self.logger.error(f"Error processing category {item[self.progress_tracking_key]}: {e}")
-            return []
+            self.logger.warning(f"Error fetching remaining pages, continuing by navigation: {e}")
+            if fetched_pages:
+                # Pick up after the pages already sent instead of sending them again
+                resume_url = page_urls[fetched_pages] if fetched_pages < len(page_urls) else None
+                return fetched_pages, fetched_products, resume_url
+            return 0, 0, None
+    
+    def _parse_numeric_fields(self, products: List[ProductRow]) -> List[Dict[str, Any]]:
+        """Convert the raw price and reviews strings of a page's products to numbers, returning output rows"""
+        return [
+            dict(
+                product._asdict(),
+                product_price=_parse_price(product.product_price),
+                product_reviews=_parse_review_count(product.product_reviews)
+            )
+            for product in products
+        ]
     
     def _apply_filters(self, item: Dict[str, Any]) -> bool:
-        """Apply various filters to the product listing"""
+        """Apply the enabled filters with a single navigation to the composed filter URL"""
+        if not (self.apply_four_stars_filter or self.apply_shipping_by_amazon_filter or self.apply_price_filter):
+            return True
+        
+        filter_url = self._compose_filter_url(item)
+        if filter_url:
+            self.logger.info("Applying filters")
+            if self._navigate_to_url(filter_url):
+                self.logger.info("Filters applied successfully")
+                return True
+            
+            # Start over from the unfiltered page and apply the filters one by one
+            self.logger.warning("Failed to apply composed filters, applying them one by one")
+            if not self._navigate_to_url(item[self.progress_tracking_key]):
+                return False
+        
+        return self._apply_filters_sequentially(item)
+    
+    def _compose_filter_url(self, item: Dict[str, Any]) -> Optional[str]:
+        """Build the URL with every enabled filter from the filter links of the current page, None if it cannot be built"""
+        try:
+            filter_urls = []
+            
+            if self.apply_four_stars_filter:
+                four_stars_filter = self._find_one_or_none("four_stars_filter")
+                if not four_stars_filter:
+                    return None
+                filter_urls.append(four_stars_filter.get_attribute("href"))
+            
+            if self.apply_shipping_by_amazon_filter:
+                shipping_by_amazon_filter = self._find_one_or_none("shipping_by_amazon_filter")
+                if shipping_by_amazon_filter:
+                    filter_urls.append(shipping_by_amazon_filter.get_attribute("href"))
+                else:
+                    self.logger.warning("Amazon shipping filter not found, proceeding without it")
+            
+            if not all(filter_urls):
+                return None
+            
+            filter_url = _merge_filter_urls(filter_urls or [self._current_url or self.driver.current_url])
+            
+            if self.apply_price_filter:
+                filter_url = _set_query_params(filter_url, {
+                    "low-price": item.get("lower_price", "0"),
+                    "high-price": item.get("higher_price", "99999")
+                })
+            
+            return filter_url
+        
+        except Exception as e:
+            self.logger.warning(f"Could not compose filter URL: {e}")
+            return None
+    
+    def _apply_filters_sequentially(self, item: Dict[str, Any]) -> bool:
+        """Apply various filters to the product listing, one navigation per filter"""
         try:
             # Apply 4-stars filter if enabled
             if self.apply_four_stars_filter:
-                four_stars_filter = self._find_elements("four_stars_filter")
+                four_stars_filter = self._find_one_or_none("four_stars_filter")
                 if four_stars_filter:
-                    four_stars_filter_url = four_stars_filter[0].get_attribute("href")
+                    four_stars_filter_url = four_stars_filter.get_attribute("href")
                     self.logger.info("Applying 4-stars filter")
                     if not self._navigate_to_url(four_stars_filter_url):
                         self.logger.warning("Failed to apply 4-stars filter")
@@ -164,9 +453,9 @@ class MainProductsURLSScraper(SavageScraper):
 
             # Apply shipping filter if enabled
             if self.apply_shipping_by_amazon_filter:
-                shipping_by_amazon_filter = self._find_elements("shipping_by_amazon_filter")
+                shipping_by_amazon_filter = self._find_one_or_none("shipping_by_amazon_filter")
                 if shipping_by_amazon_filter:
-                    shipping_by_amazon_url = shipping_by_amazon_filter[0].get_attribute("href")
+                    shipping_by_amazon_url = shipping_by_amazon_filter.get_attribute("href")
                     self.logger.info("Applying shipping filter")
                     
                     if not self._navigate_to_url(shipping_by_amazon_url):
@@ -178,12 +467,12 @@ class MainProductsURLSScraper(SavageScraper):
 
             # Apply price filter 
             if self.apply_price_filter:
-                current_url = self.driver.current_url
+                current_url = self._current_url or self.driver.current_url
                 lower_price = item.get("lower_price", "0")
                 higher_price = item.get("higher_price", "99999")
 
                 self.logger.info("Applying price filter...")
-                price_filter_url = f"{current_url}&low-price={lower_price}&high-price={higher_price}"
+                price_filter_url = _set_query_params(current_url, {"low-price": lower_price, "high-price": higher_price})
 
                 if not self._navigate_to_url(price_filter_url):
                     self.logger.warning("Failed to apply price filter")
@@ -197,89 +486,93 @@ class MainProductsURLSScraper(SavageScraper):
             self.logger.error(f"Error applying filters: {e}")
             return False
     
-    def _has_next_page(self) -> bool:
-        """Check if there is a next page button"""
-        next_page_elements = self._find_elements("products_next_page")
-        return bool(next_page_elements)
-    
-    def _navigate_to_next_page(self) -> bool:
-        """Navigate to the next page"""
+    def _next_page_url(self) -> Optional[str]:
+        """Get the next page URL in a single script call, None if there is no next page"""
         try:
-            next_page_elements = self._find_elements("products_next_page")
-            if next_page_elements:
-                next_page_url = next_page_elements[0].get_attribute("href")
-                if next_page_url:
-                    return self._navigate_to_url(next_page_url)
-                else:
-                    self.logger.warning("Next page URL is empty")
-                    return False
-            else:
-                self.logger.info("Next page button not found")
-                return False
+            return self._execute_page_script(
+                "const next = findFirst(document, arguments[0]); return next ? next.href || null : null;",
+                self._selector_specs("products_next_page")
+            )
         except Exception as e:
-            self.logger.error(f"Error navigating to next page: {e}")
-            return False
+            self.logger.error(f"Error reading next page URL: {e}")
+            return None
     
-    def _extract_products_from_page(self, item: Dict[str, Any], page: int) -> List[Dict]:
+    def _extract_products_from_page(self, item: Dict[str, Any], page: int) -> List[ProductRow]:
         """Extract products from current page"""
         products = []
         
         try:
-            # Wait for products to load
-            if not self._wait_for_page_ready():
-                self.logger.warning(f"Page not ready on page {page}")
+            # Collect [url, price_html, reviews_text] for every container in a single script call,
+            # only waiting for the page ready indicator when no container is there yet
+            rows = self._extract_product_rows()
+            if not rows:
+                if not self._wait_for_page_ready():
+                    self.logger.warning(f"Page not ready on page {page}")
+                rows = self._extract_product_rows()
             
-            product_containers = self._find_elements("products_container")
-            
-            if not product_containers:
+            if not rows:
                 self.logger.warning(f"No product containers found on page {page}")
                 return products
             
-            self.logger.debug(f"Found {len(product_containers)} product containers on page {page}")
-
-            for i, container in enumerate(product_containers, 1):
-                try:
-                    # Extract product data using container-specific search
-                    product_url_elements = self._find_elements("products_url", container)
-                    # Skip if no URL found (essential field)
-                    if not product_url_elements:
-                        self.logger.debug(f"No URL found for product {i}, skipping")
-                        continue
-
-                    product_reviews = self._find_elements("products_reviews", container)
-                    product_price = self._find_elements('products_price', container)
+            self.logger.debug(f"Found {len(rows)} product containers on page {page}")
 
-                    # Extract data with fallbacks
-                    product_data = {
-                        "N1": item["N1"],
-                        "N2": item["N2"],
-                        "N3": item["N3"],
-                        "N4": item["N4"],
-                        "N5": item["N5"],
-                        "product_url": product_url_elements[0].get_attribute("href"),
-                        "product_reviews": self.get_clean_text(product_reviews[0]) if product_reviews else "",
-                        "product_price": product_price[0].get_attribute("innerHTML") if product_price else "",
-                        "N3_url": item["N3_url"],
-                        "N4_url": item["N4_url"],
-                        "N5_url": item["N5_url"],
-                        "page": page,
-                        "position_in_page": i,
-                        'scraped_at': datetime.now().isoformat(),
-                        'process_id': self.process_id
-                    }
-                    products.append(product_data)
-                    self.logger.debug(f"Extracted product {i}: {product_data.get('product_url', '')}")
-                
-                except Exception as e:
-                    self.logger.warning(f"Error processing product container {i}: {e}")
-                    continue
+            products = self._products_from_rows(rows, item, page)
             
-            self.logger.info(f"Successfully extracted {len(products)} products from page {page}")
+            self.logger.debug(f"Successfully extracted {len(products)} products from page {page}")
             return products
         
         except Exception as e:
             self.logger.error(f"Error extracting products from page {page}: {e}")
             return products
+    
+    def _extract_product_rows(self) -> List[List[Any]]:
+        """Get [url, price_html, reviews_text] for every product container of the current page"""
+        return self._execute_page_script(
+            self._EXTRACT_PRODUCTS_JS,
+            self._selector_specs("products_container"),
+            self._selector_specs("products_url"),
+            self._selector_specs("products_price"),
+            self._selector_specs("products_reviews")
+        )
+    
+    def _products_from_rows(self, rows: List[List[Any]], item: Dict[str, Any], page: int) -> List[ProductRow]:
+        """Build the product rows of a page from the rows returned by productRows"""
+        # Template row; the item and page columns are the same for every product
+        template = ProductRow(
+            N1=item["N1"],
+            N2=item["N2"],
+            N3=item["N3"],
+            N4=item["N4"],
+            N5=item["N5"],
+            product_url="",
+            product_reviews="",
+            product_price="",
+            N3_url=item["N3_url"],
+            N4_url=item["N4_url"],
+            N5_url=item["N5_url"],
+            page=page,
+            position_in_page=0
+        )
+
+        return [
+            product for product in (self._build_product(row, template, i) for i, row in enumerate(rows, 1))
+            if product is not None
+        ]
+    
+    def _build_product(self, row: List[Any], template: ProductRow, position: int) -> Optional[ProductRow]:
+        """Build a product row from an extracted [url, price_html, reviews_text] row, None if it has no URL"""
+        product_url, product_price, product_reviews = row
+        # Skip if no URL found (essential field)
+        if not product_url:
+            self.logger.debug(f"No URL found for product {position}, skipping")
+            return None
+        
+        return template._replace(
+            product_url=product_url,
+            product_reviews=self._clean_text(product_reviews) if product_reviews else "",
+            product_price=product_price or "",
+            position_in_page=position
+        )
 
 
 def load_n5_categories(output_dir: Path, key: str) -> List[Dict[str, Any]]:
@@ -291,10 +584,12 @@ def load_n5_categories(output_dir: Path, key: str) -> List[Dict[str, Any]]:
             print(f"Input file not found: {input_file}")
             return []
         
-        input_data = pd.read_csv(input_file, encoding='utf-8')
+        # Only parse the columns the scraper needs, as plain strings
+        required_columns = ['N1', 'N2', 'N3', 'N4', 'N5', 'N3_url', 'N4_url', 'N5_url', 'lower_price', 'higher_price']
+        input_data = pd.read_csv(input_file, encoding='utf-8', usecols=lambda col: col in required_columns,
+                                 dtype=str)
         
         # Check required columns
-        required_columns = ['N1', 'N2', 'N3', 'N4', 'N5', 'N3_url', 'N4_url', 'N5_url', 'lower_price', 'higher_price']
         missing_columns = [col for col in required_columns if col not in input_data.columns]
         if missing_columns:
             print(f"Input file is missing required columns: {missing_columns}")
@@ -306,10 +601,9 @@ def load_n5_categories(output_dir: Path, key: str) -> List[Dict[str, Any]]:
         
         print(f"Total rows in input file: {len(input_data)}")
         
-        # Filter out rows where N5_url is empty or null
+        # Filter out rows where N5_url is empty or null in a single mask
         before_filter = len(input_data)
-        input_data = input_data.dropna(subset=['N5_url'])
-        input_data = input_data[input_data['N5_url'].str.strip() != '']
+        input_data = input_data.loc[input_data['N5_url'].fillna('').str.strip() != '']
         after_filter = len(input_data)
         
         if before_filter != after_filter:
@@ -336,10 +630,12 @@ def load_n5_categories(output_dir: Path, key: str) -> List[Dict[str, Any]]:
 
 
 def run_products_urls_scraper(config_dir=None, output_dir=None, logs_dir=None, 
-                             num_processes=7, is_headless=True, translation=False,
+                             num_processes=None, is_headless=True, translation=False,
                              apply_four_stars_filter=True, apply_shipping_by_amazon_filter=True,
                              apply_price_filter=True, max_pages=100):
-    """Run Products URLs scraper with multiprocessing"""
+    """Run Products URLs scraper with multiprocessing, sizing the number of processes to the machine when not given"""
+    if num_processes is None:
+        num_processes = default_num_processes()
     
     # Setup directories
     config_dir = Path(config_dir) if config_dir else Path("./config")
@@ -404,7 +700,7 @@ if __name__ == "__main__":
         config_dir="../config",
         output_dir="../results",
         logs_dir="../logs",
-        num_processes=8,
+        num_processes=None,
         is_headless=True,
         translation=False,
         apply_four_stars_filter=True,
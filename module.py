@@ -12,27 +12,107 @@ import threading
 import queue
 import time
 import json
+import copy
+import pickle
+import csv
 import logging
 import sys
 import signal
 import os
 import fcntl
+import shutil
 from pathlib import Path
-from typing import List, Dict, Any, Type, Optional
+from typing import List, Dict, Any, Type, Optional, Tuple, Iterator, Callable
 from abc import ABC, abstractmethod
 from datetime import datetime, timedelta
-import pandas as pd
 from contextlib import contextmanager
+from concurrent.futures import ThreadPoolExecutor
+from logging.handlers import QueueHandler, QueueListener
+from functools import lru_cache
 from selenium import webdriver
 from selenium.webdriver.common.by import By
 from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
-from selenium.common.exceptions import TimeoutException
+from selenium.common.exceptions import TimeoutException, InvalidSessionIdException, NoSuchElementException
 from selenium.webdriver.remote.webelement import WebElement
 import random
 import re
 
+try:
+    import orjson
+except ImportError:  # orjson is optional: without it JSON Lines output is encoded with the json module
+    orjson = None
+
+
+# Logger used until setup_process_logging attaches the real one, every call on it is a no-op
+_NOOP_LOGGER = logging.getLogger('savage.noop')
+_NOOP_LOGGER.addHandler(logging.NullHandler())
+_NOOP_LOGGER.setLevel(logging.CRITICAL + 1)
+_NOOP_LOGGER.propagate = False
+
+
+# Field of the output queue message recording an item processed without results
+_PROCESSED_KEY_FIELD = '__processed_key__'
+
+
+def processed_keys_file(output_file: Path) -> Path:
+    """Path of the file listing the keys of items processed without results, next to the output file"""
+    return output_file.with_name(f"{output_file.stem}.processed.keys")
+
+
+def output_shard_file(output_file: Path, process_id: int) -> Path:
+    """Path of the part of the output written by one worker when output is sharded"""
+    return output_file.with_name(f"{output_file.stem}.part{process_id}{output_file.suffix}")
+
+
+# Patterns used by SavageScraper._clean_text
+_HTML_TAG_RE = re.compile(r'<[^>]+>')
+_WHITESPACE_RE = re.compile(r'\s+')
+_HTML_ENTITIES = {'&nbsp;': ' ', '&amp;': '&', '&lt;': '<', '&gt;': '>'}
+_HTML_ENTITY_RE = re.compile('|'.join(map(re.escape, _HTML_ENTITIES)))
+
+
+def _replace_html_entity(match) -> str:
+    return _HTML_ENTITIES[match.group(0)]
+
+
+def _thread_local_property(name: str, default=None) -> property:
+    """Attribute stored per thread, so each driver thread of a worker has its own driver and item state"""
+    def getter(self):
+        return getattr(self._local, name, default)
+    
+    def setter(self, value):
+        setattr(self._local, name, value)
+    
+    return property(getter, setter)
+
+
+# Parsed config files by (path, modification time), so the scraper instances of a run share one parse
+_CONFIG_CACHE = {}
+_CONFIG_CACHE_LOCK = threading.Lock()
+
+
+def _read_config_file(config_file: Path) -> Dict[str, Any]:
+    """Parse a JSON config file, reusing the previous parse while the file is unchanged. Returns a private copy."""
+    key = (str(config_file), config_file.stat().st_mtime_ns)
+    with _CONFIG_CACHE_LOCK:
+        config = _CONFIG_CACHE.get(key)
+        if config is None:
+            with open(config_file, 'r', encoding='utf-8') as f:
+                config = json.load(f)
+            _CONFIG_CACHE.clear()
+            _CONFIG_CACHE[key] = config
+    return copy.deepcopy(config)
+
+
+@lru_cache(maxsize=256)
+def _resolve_selector_type(selector: str) -> str:
+    """Determine selector type (CSS or XPath), cached since the same selectors are resolved on every page"""
+    if selector.startswith(('//', './', '/', '(/','(./)')):
+        return By.XPATH
+    return By.CSS_SELECTOR
+
 
 class SavageScraper(ABC):
     """Base class for scrapers"""
@@ -46,6 +126,122 @@ class SavageScraper(ABC):
     
     WAIT_TIMEOUT = 3
     
+    # Seconds between two probes of _wait_for_page_ready, shorter than WebDriverWait's default half second
+    READY_POLL_INTERVAL = 0.1
+    
+    # 'eager' returns from driver.get() on DOMContentLoaded, the page ready selector wait covers the rest
+    PAGE_LOAD_STRATEGY = "eager"
+    
+    # The driver lives for the whole batch; cookies are cleared between items instead of restarting Chrome
+    CLEAR_COOKIES_BETWEEN_ITEMS = True
+    
+    # Items without results are recorded in the processed keys file instead of an empty output row.
+    # Set to True to keep writing the rows made by _create_empty_result
+    WRITE_EMPTY_RESULTS = False
+    
+    # Resume from the processed keys file only, for scrapers streaming the rows of an item while processing it:
+    # an item is then skipped only once _mark_processed recorded it as complete, not as soon as some of its rows exist
+    RESUME_FROM_PROCESSED_KEYS = False
+    
+    # Workers append to their own part of the output file, merged into it by the main process at the end of the run,
+    # instead of sending every row to the output writer thread
+    SHARDED_OUTPUT = False
+    
+    # Pickled size aimed at per put to the output writer, the rows per put follow from the size of the first
+    # OUTPUT_SIZE_SAMPLES rows. Pending rows are also sent once OUTPUT_PUT_INTERVAL seconds old
+    OUTPUT_PUT_BYTES = int(os.environ.get('SAVAGE_OUTPUT_PUT_BYTES', 1024 * 1024))
+    OUTPUT_PUT_INTERVAL = 0.25
+    OUTPUT_SIZE_SAMPLES = 20
+    
+    # Attempts per navigation, retried after a handled error page or a recycled driver
+    NAVIGATION_ATTEMPTS = 3
+    
+    # Chrome instances driven by each worker process, one thread per driver.
+    # Above 1, page loads of different items overlap inside a single process
+    DRIVERS_PER_PROCESS = 1
+    
+    # Size of the HTTP connection pool between the Selenium client and chromedriver
+    HTTP_POOL_MAXSIZE = 20
+    
+    # Resources the scraper never reads, blocked at the network level to speed up page loads
+    BLOCKED_URL_PATTERNS = [
+        "*.png", "*.jpg", "*.jpeg", "*.webp", "*.gif",
+        "*.woff", "*.woff2", "*.css", "*.mp4",
+        "*/gtm.js", "*google-analytics*", "*googletagmanager*",
+        "*doubleclick*", "*/fls-*"
+    ]
+    
+    # Helpers available to in-page scripts run through _execute_page_script.
+    # A selector spec is a [by, selector] pair as returned by _selector_specs.
+    _JS_SELECTOR_HELPERS = """
+        function findAll(root, specs) {
+            for (const [by, selector] of specs || []) {
+                let found = [];
+                try {
+                    if (by === 'xpath') {
+                        const doc = root.ownerDocument || root;
+                        const snapshot = doc.evaluate(selector, root, null, XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null);
+                        for (let i = 0; i < snapshot.snapshotLength; i++) {
+                            found.push(snapshot.snapshotItem(i));
+                        }
+                    } else {
+                        found = Array.from(root.querySelectorAll(selector));
+                    }
+                } catch (e) {
+                    found = [];
+                }
+                if (found.length) {
+                    return found;
+                }
+            }
+            return [];
+        }
+        function findFirst(root, specs) {
+            const found = findAll(root, specs);
+            return found.length ? found[0] : null;
+        }
+    """
+    
+    # True once the document is parsed and one of the selectors in arguments[0] matches
+    _PAGE_HAS_JS = "return document.readyState !== 'loading' && findFirst(document, arguments[0]) !== null;"
+    
+    # Returns the first non-blank of innerText, textContent and innerHTML for arguments[0]
+    _RAW_TEXT_JS = """
+        const el = arguments[0];
+        for (const value of [el.innerText, el.textContent, el.innerHTML]) {
+            if (value && value.trim()) {
+                return value;
+            }
+        }
+        return '';
+    """
+    
+    # Same raw text lookup as _RAW_TEXT_JS, for a whole list of elements in one call
+    _RAW_TEXTS_JS = """
+        return arguments[0].map(el => {
+            for (const value of [el.innerText, el.textContent, el.innerHTML]) {
+                if (value && value.trim()) {
+                    return value;
+                }
+            }
+            return '';
+        });
+    """
+    
+    # Elements matched by the first selector spec that matches anything, under arguments[0] or the document
+    _FIND_ELEMENTS_JS = """
+        return findAll(arguments[0] || document, arguments[1]);
+    """
+    
+    # Selenium components and per item state, kept per driver thread
+    driver = _thread_local_property('driver')
+    wait = _thread_local_property('wait')
+    _current_url = _thread_local_property('current_url')
+    _item_scraped_at = _thread_local_property('item_scraped_at')
+    _emitted_count = _thread_local_property('emitted_count', 0)
+    _items_on_driver = _thread_local_property('items_on_driver', 0)
+    _prefetched_text = _thread_local_property('prefetched_text', {})
+    
     def __init__(self, config_dir=None, output_dir=None, logs_dir=None, 
                  error_pages_dir=None, is_headless=False, translation=False, process_id=None):
         self.process_id = process_id or 0
@@ -55,11 +251,37 @@ class SavageScraper(ABC):
         self.error_pages_dir = Path(error_pages_dir) if error_pages_dir else Path("../error_pages")
         self.is_headless = is_headless
         self.translation = translation
+        self.logger = _NOOP_LOGGER
+        self._local = threading.local()
+        
+        # Output state for the item being processed, set by process_batch
+        self._output_queue = None
+        self._item_scraped_at = None
+        self._emitted_count = 0
+        
+        # Messages waiting to be sent to the output writer as one list, shared by the driver threads
+        self._pending_output = []
+        self._pending_output_since = time.monotonic()
+        self._pending_output_lock = threading.Lock()
+        # Rows per put, recomputed from the sampled row sizes until OUTPUT_SIZE_SAMPLES rows were measured
+        self._output_put_rows = 1
+        self._sampled_rows = 0
+        self._sampled_bytes = 0
         
         # Selenium components
         self.driver = None
         self.wait = None
         
+        # Every driver started by this worker, so all of them are closed at the end of the batch
+        self._drivers = []
+        self._drivers_lock = threading.Lock()
+        
+        # Last URL successfully navigated to, saves asking the driver for current_url
+        self._current_url = None
+        
+        # CPUs the worker and the Chrome instances it starts are pinned to, set by run_multiprocess_scraper on NUMA hosts
+        self.cpu_affinity = None
+        
         # Create directories
         self.config_dir.mkdir(exist_ok=True)
         self.output_dir.mkdir(exist_ok=True)
@@ -71,21 +293,49 @@ class SavageScraper(ABC):
         
         # Set up progress tracking
         self.progress_tracking_key = self._get_progress_tracking_key()
+        
+        # These only depend on the configuration, resolve them once
+        self.output_file_path = self._get_output_file_path()
+        self.resume_key = self._get_resume_key()
+        self.page_ready_selector = self._get_page_ready_selector()
+    
+    def __getstate__(self):
+        """Thread-local state and locks can't be pickled, workers started with spawn get fresh ones"""
+        state = self.__dict__.copy()
+        for name in ('_local', '_drivers', '_drivers_lock', '_pending_output_lock'):
+            state.pop(name, None)
+        return state
+    
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._local = threading.local()
+        self._drivers = []
+        self._drivers_lock = threading.Lock()
+        self._pending_output_lock = threading.Lock()
     
     def _load_configuration(self):
         """Load configuration from JSON file"""
         config_file = self.config_dir / "config.json"
         try:
-            with open(config_file, 'r', encoding='utf-8') as f:
-                self.config = json.load(f)
+            self.config = _read_config_file(config_file)
             self.key = self.config.get('KEY', 'default')
             self.country = self.config.get('COUNTRY', 'MA')
             self.base_url = self.config.get('BASE_URL', '')
             self.selectors = self.config.get('SELECTORS', {})
+            # Selector type resolved once per configured selector, lookups iterate these pairs directly
+            self._resolved_selectors = {
+                key: [(_resolve_selector_type(selector), selector) for selector in selectors]
+                for key, selectors in self.selectors.items()
+            }
+            # Per item and per page logs are only sent to the log queue in verbose mode
+            self.verbose = bool(self.config.get('VERBOSE', False))
         except Exception as e:
             print(f"Error loading configuration: {e}")
             self.config = {}
             self.key = 'default'
+            self.selectors = {}
+            self._resolved_selectors = {}
+            self.verbose = False
     
     @abstractmethod
     def _get_progress_tracking_key(self) -> str:
@@ -129,52 +379,111 @@ class SavageScraper(ABC):
     
     def _load_existing_results(self) -> set:
         """Load existing results to support resume functionality"""
-        output_file = self._get_output_file_path()
+        output_file = self.output_file_path
+        existing_keys = self._load_processed_keys()
         if not output_file.exists():
-            return set()
+            return existing_keys
+        if not self.RESUME_FROM_PROCESSED_KEYS:
+            return self._load_output_keys(existing_keys)
+        
+        keys_file = processed_keys_file(output_file)
+        if keys_file.exists():
+            return existing_keys
         
+        # Output written before the scraper kept a processed keys file: seed it once from the output's resume key column
+        self.logger.warning(
+            f"No processed keys file for existing output {output_file}, creating it from the output. "
+            f"Items interrupted halfway in earlier runs count as processed"
+        )
+        existing_keys = self._load_output_keys(existing_keys)
         try:
-            existing_df = pd.read_csv(output_file, encoding='utf-8')
-            if existing_df.empty:
-                return set()
+            with open(keys_file, 'w', encoding='utf-8') as f:
+                f.write(''.join(f"{key}\n" for key in existing_keys))
+        except Exception as e:
+            self.logger.warning(f"Error creating processed keys file: {e}")
+        return existing_keys
+    
+    def _load_output_keys(self, existing_keys: set) -> set:
+        """Add the resume key values found in the output file to existing_keys"""
+        output_file = self.output_file_path
+        try:
+            resume_key = self.resume_key
+            
+            if output_file.suffix == '.jsonl':
+                # JSON Lines output: only the resume key is kept from each record.
+                # A corrupt line, such as one cut short by a killed writer, is skipped without losing the lines after it
+                bad_lines = 0
+                with open(output_file, 'r', encoding='utf-8') as f:
+                    for line in f:
+                        if not line.strip():
+                            continue
+                        try:
+                            record = json.loads(line)
+                        except json.JSONDecodeError:
+                            bad_lines += 1
+                            continue
+                        if not isinstance(record, dict):
+                            bad_lines += 1
+                            continue
+                        value = record.get(resume_key)
+                        if value is not None:
+                            existing_keys.add(str(value))
+                if bad_lines:
+                    self.logger.warning(f"Skipped {bad_lines} corrupt lines in output file")
+                self.logger.info(f"Found {len(existing_keys)} existing entries in output file")
+                return existing_keys
             
-            resume_key = self._get_resume_key()
-            if resume_key not in existing_df.columns:
-                if hasattr(self, 'logger'):
+            # CSV output: stream the rows, only the resume key column is kept
+            with open(output_file, 'r', encoding='utf-8', newline='') as f:
+                reader = csv.reader(f)
+                header = next(reader, None)
+                if not header:
+                    return existing_keys
+                
+                if resume_key not in header:
                     self.logger.warning(f"Resume key '{resume_key}' not found in existing output file")
-                return set()
+                    return existing_keys
+                
+                # Get unique values of the resume key
+                index = header.index(resume_key)
+                existing_keys.update(row[index] for row in reader if len(row) > index and row[index])
             
-            # Get unique values of the resume key
-            existing_keys = set(existing_df[resume_key].dropna().astype(str))
-            if hasattr(self, 'logger'):
-                self.logger.info(f"Found {len(existing_keys)} existing entries in output file")
+            self.logger.info(f"Found {len(existing_keys)} existing entries in output file")
             return existing_keys
             
         except Exception as e:
-            if hasattr(self, 'logger'):
-                self.logger.warning(f"Error loading existing results for resume: {e}")
+            self.logger.warning(f"Error loading existing results for resume: {e}")
+            return existing_keys
+    
+    def _load_processed_keys(self) -> set:
+        """Load the keys of items already processed without results"""
+        keys_file = processed_keys_file(self.output_file_path)
+        if not keys_file.exists():
+            return set()
+        
+        try:
+            with open(keys_file, 'r', encoding='utf-8') as f:
+                return {line.rstrip('\n') for line in f if line.strip()}
+        except Exception as e:
+            self.logger.warning(f"Error loading processed keys for resume: {e}")
             return set()
     
     def _filter_items_for_resume(self, items: List[Dict]) -> List[Dict]:
         """Filter out items that have already been processed"""
-        existing_keys = self._load_existing_results()
+        existing_keys = frozenset(self._load_existing_results())
         if not existing_keys:
             return items
         
-        resume_key = self._get_resume_key()
-        filtered_items = []
-        
-        for item in items:
-            item_key = str(item.get(resume_key, ''))
-            if item_key and item_key not in existing_keys:
-                filtered_items.append(item)
+        resume_key = self.resume_key
+        item_keys = [str(item.get(resume_key, '')) for item in items]
+        filtered_items = [
+            item for item, item_key in zip(items, item_keys)
+            if item_key and item_key not in existing_keys
+        ]
         
         skipped_count = len(items) - len(filtered_items)
         if skipped_count > 0:
-            if hasattr(self, 'logger'):
-                self.logger.info(f"Resume: Skipping {skipped_count} already processed items")
-            else:
-                print(f"Resume: Skipping {skipped_count} already processed items")
+            self.logger.info(f"Resume: Skipping {skipped_count} already processed items")
         
         return filtered_items
     
@@ -182,7 +491,8 @@ class SavageScraper(ABC):
         """Setup logging for this process to send to main logger"""
         # Create a logger for this process
         self.logger = logging.getLogger(f"{self.__class__.__name__}_P{self.process_id}")
-        self.logger.setLevel(logging.INFO)
+        level = logging.DEBUG if self.verbose else logging.INFO
+        self.logger.setLevel(level)
         
         # Remove any existing handlers
         for handler in self.logger.handlers[:]:
@@ -190,11 +500,8 @@ class SavageScraper(ABC):
         
         # Add queue handler
         queue_handler = QueueHandler(log_queue)
-        queue_handler.setLevel(logging.INFO)
-        formatter = logging.Formatter(
-            f'%(asctime)s - P{self.process_id} - %(name)s - %(levelname)s - %(message)s'
-        )
-        queue_handler.setFormatter(formatter)
+        # Only the message is rendered here, the listener adds the time, logger name (with the process id) and level
+        queue_handler.setLevel(level)
         self.logger.addHandler(queue_handler)
         
         # Prevent propagation to avoid duplicate logs
@@ -204,14 +511,10 @@ class SavageScraper(ABC):
         """Initialize Chrome WebDriver"""
         try:
             # Clean up any existing driver
-            if self.driver:
-                try:
-                    self.driver.quit()
-                except Exception:
-                    pass
-                self.driver = None
+            self._quit_driver()
             
             options = Options()
+            options.page_load_strategy = self.PAGE_LOAD_STRATEGY
             
             if self.is_headless:
                 options.add_argument("--headless")
@@ -230,6 +533,7 @@ class SavageScraper(ABC):
             options.add_argument("--disable-logging")
             options.add_argument("--disable-gpu-logging")
             options.add_argument("--silent")
+            options.add_argument("--blink-settings=imagesEnabled=false")
             
             # Random user agent
             user_agent = random.choice(self.USER_AGENTS)
@@ -243,6 +547,8 @@ class SavageScraper(ABC):
             prefs = {
                 "profile.default_content_setting_values.notifications": 2,
                 "profile.default_content_settings.popups": 0,
+                # Images are never read, skip them even where the CDP block list does not apply
+                "profile.managed_default_content_settings.images": 2,
             }
 
             if self.translation:
@@ -255,76 +561,148 @@ class SavageScraper(ABC):
             
             options.add_experimental_option("prefs", prefs)
             
-            if hasattr(self, 'logger'):
-                self.logger.info(f"Initializing Chrome WebDriver for process {self.process_id}")
+            self.logger.info(f"Initializing Chrome WebDriver for process {self.process_id}")
             
             self.driver = webdriver.Chrome(options=options)
+            with self._drivers_lock:
+                self._drivers.append(self.driver)
+            self._tune_connection_pool()
+            self._block_resources()
             self.driver.execute_script("Object.defineProperty(navigator, 'webdriver', {get: () => undefined})")
             self.driver.set_window_size(1920, 1080)
             
             self.wait = WebDriverWait(self.driver, self.WAIT_TIMEOUT)
             
-            if hasattr(self, 'logger'):
-                self.logger.info(f"WebDriver initialized successfully for process {self.process_id}")
+            self.logger.info(f"WebDriver initialized successfully for process {self.process_id}")
             return True
             
         except Exception as e:
             error_msg = f"Failed to initialize WebDriver for process {self.process_id}: {e}"
-            if hasattr(self, 'logger'):
-                self.logger.error(error_msg)
-            else:
-                print(error_msg)
+            self.logger.error(error_msg)
             
             # Clean up on failure
-            if self.driver:
-                try:
-                    self.driver.quit()
-                except Exception:
-                    pass
-                self.driver = None
+            self._quit_driver()
             
             return False
     
-    def _wait_for_page_ready(self) -> bool:
-        """Wait for page ready indicator"""
-        elements = self._find_elements(self._get_page_ready_selector())
-        return bool(elements)
+    def _quit_driver(self):
+        """Quit this thread's driver, if any"""
+        driver = self.driver
+        if not driver:
+            return
+        self.driver = None
+        with self._drivers_lock:
+            if driver in self._drivers:
+                self._drivers.remove(driver)
+        try:
+            driver.quit()
+        except Exception:
+            pass
     
-    def _navigate_to_url(self, url: str) -> bool:
-        """Navigate to URL and wait for page ready"""
+    def _tune_connection_pool(self):
+        """Keep connections to chromedriver alive and enlarge the urllib3 pool so commands keep reusing them"""
+        try:
+            command_executor = self.driver.command_executor
+            # Sends 'Connection: keep-alive' with every command, local Chrome drivers already default to it
+            command_executor.keep_alive = True
+            pool_manager = command_executor._conn
+            pool_manager.connection_pool_kw['maxsize'] = self.HTTP_POOL_MAXSIZE
+            pool_manager.connection_pool_kw['block'] = False
+            # Drop the pool created for the new session so the next command rebuilds it with the new size
+            pool_manager.clear()
+        except Exception as e:
+            self.logger.warning(f"Could not resize WebDriver connection pool: {e}")
+    
+    def _block_resources(self):
+        """Block non-essential resources through the Chrome DevTools Protocol"""
+        if not self.BLOCKED_URL_PATTERNS:
+            return
+        try:
+            self.driver.execute_cdp_cmd('Network.enable', {})
+            self.driver.execute_cdp_cmd('Network.setBlockedURLs', {'urls': self.BLOCKED_URL_PATTERNS})
+        except Exception as e:
+            self.logger.warning(f"Could not block resources via CDP: {e}")
+    
+    def _reset_driver_state(self) -> bool:
+        """Prepare the running driver for the next item, recycling it only if its session is gone"""
         try:
-            if hasattr(self, 'logger'):
-                self.logger.info(f"Navigating to: {url}")
-            self.driver.get(url)
-            
-            # Wait for page to be ready
-            if self._wait_for_page_ready():
-                if hasattr(self, 'logger'):
-                    self.logger.info("Page loaded successfully")
+            if self.CLEAR_COOKIES_BETWEEN_ITEMS:
+                self.driver.delete_all_cookies()
+            return True
+        except InvalidSessionIdException:
+            self.logger.warning(f"WebDriver session lost in process {self.process_id}, recycling driver")
+            return self._init_driver()
+        except Exception as e:
+            self.logger.warning(f"Error resetting WebDriver state: {e}")
+            return True
+    
+    def _wait_for_page_ready(self) -> bool:
+        """Wait for page ready indicator, probing the page every READY_POLL_INTERVAL seconds up to WAIT_TIMEOUT"""
+        specs = self._selector_specs(self.page_ready_selector)
+        deadline = time.time() + self.WAIT_TIMEOUT
+        while True:
+            if self._page_has(specs):
                 return True
-            else:
-                if hasattr(self, 'logger'):
-                    self.logger.warning("Page not ready, checking for error page")
+            if time.time() >= deadline:
+                return False
+            time.sleep(self.READY_POLL_INTERVAL)
+    
+    def _page_has(self, specs: List[Tuple[str, str]]) -> bool:
+        """Check once, without waiting, whether the parsed page matches one of the selector specs"""
+        try:
+            return bool(self._execute_page_script(self._PAGE_HAS_JS, specs))
+        except InvalidSessionIdException:
+            raise
+        except Exception:
+            return False
+    
+    def _navigate_to_url(self, url: str) -> bool:
+        """Navigate to URL and wait for page ready, retrying after a handled error page or a lost session"""
+        session_recycled = False
+        
+        for attempt in range(self.NAVIGATION_ATTEMPTS):
+            try:
+                self.logger.debug(f"Navigating to: {url}")
+                self._current_url = None
+                self.driver.get(url)
+                
+                # Wait for page to be ready
+                if self._wait_for_page_ready():
+                    self.logger.debug("Page loaded successfully")
+                    self._current_url = url
+                    return True
+                
+                self.logger.warning("Page not ready, checking for error page")
                 if self._is_error_page():
                     if self._handle_error_page():
-                        return self._navigate_to_url(url)  # Retry
+                        continue  # Retry
                 else:
                     error_page_filename = self.error_pages_dir / f"./{datetime.now().strftime('%Y%m%d_%H%M%S')}.html"
                     with open(error_page_filename, "w", encoding="utf-8") as f:
                         f.write(self.driver.page_source)
-                    
-        except Exception as e:
-            if hasattr(self, 'logger'):
+                return False
+                        
+            except InvalidSessionIdException:
+                # Recycle the driver once, a second lost session means Chrome keeps dying
+                if not session_recycled:
+                    session_recycled = True
+                    self.logger.warning(f"WebDriver session lost in process {self.process_id}, recycling driver")
+                    if self._init_driver():
+                        continue
+                self.logger.error("Navigation failed: WebDriver session lost")
+                return False
+            except Exception as e:
                 self.logger.error(f"Navigation failed: {e}")
+                return False
         
+        self.logger.error(f"Navigation failed after {self.NAVIGATION_ATTEMPTS} attempts: {url}")
         return False
     
     def _is_error_page(self) -> bool:
         """Check if current page is an error page"""
-        error_elements = self._find_elements("error_page_indicator")
-        if error_elements:
-            if hasattr(self, 'logger'):
-                self.logger.warning("Error page detected")
+        # Only called once the page failed to become ready, so it's loaded already and isn't waited on
+        if self._page_has(self._selector_specs("error_page_indicator")):
+            self.logger.warning("Error page detected")
             return True
         return False
     
@@ -332,42 +710,67 @@ class SavageScraper(ABC):
         """Handle error page by clicking appropriate elements"""
         for selector in self.selectors.get('error_page_handler', []):
             if self._click_element(selector):
-                if hasattr(self, 'logger'):
-                    self.logger.info("Error page handled successfully")
+                self.logger.info("Error page handled successfully")
                 return True
 
-        if hasattr(self, 'logger'):
-            self.logger.error("Failed to handle error page")
+        self.logger.error("Failed to handle error page")
         return False
     
     def _find_elements(self, selector_key: str, container=None) -> List:
-        """Find elements using configured selectors"""
+        """Find elements using configured selectors, trying every selector in a single script call per poll"""
         if selector_key not in self.selectors:
-            if hasattr(self, 'logger'):
-                self.logger.error(f"Selector key '{selector_key}' not found in configuration")
+            self.logger.error(f"Selector key '{selector_key}' not found in configuration")
             return []
         
-        container = container or self.driver
+        specs = self._selector_specs(selector_key)
+        try:
+            # Children of an element found on a loaded page are already there, look them up once without waiting
+            if container is not None:
+                return self._execute_page_script(self._FIND_ELEMENTS_JS, container, specs)
+            
+            # The script returns an empty list until one of the selectors matches, which keeps the wait polling
+            return self.wait.until(
+                lambda driver: self._execute_page_script(self._FIND_ELEMENTS_JS, None, specs)
+            )
+        except TimeoutException:
+            return []
+        except Exception:
+            return []
+    
+    def _find_one_or_none(self, selector_key: str, container=None) -> Optional[WebElement]:
+        """Find the first element using configured selectors, without collecting every match"""
+        if selector_key not in self.selectors:
+            self.logger.error(f"Selector key '{selector_key}' not found in configuration")
+            return None
         
-        for selector in self.selectors[selector_key]:
+        for by_type, selector in self._resolved_selectors[selector_key]:
             try:
-                by_type = self._get_selector_type(selector)
-                self.wait.until(EC.presence_of_element_located((by_type, selector)))
-                elements = container.find_elements(by_type, selector)
-                if elements:
-                    return elements
-            except TimeoutException:
+                # Only wait when searching the whole document, children of a container are looked up directly
+                if container is not None:
+                    return container.find_element(by_type, selector)
+                return self.wait.until(EC.presence_of_element_located((by_type, selector)))
+            except (TimeoutException, NoSuchElementException):
                 continue
             except Exception:
                 continue
         
-        return []
+        return None
     
     def _get_selector_type(self, selector: str):
         """Determine selector type (CSS or XPath)"""
-        if selector.startswith(('//', './', '/', '(/','(./)')):
-            return By.XPATH
-        return By.CSS_SELECTOR
+        return _resolve_selector_type(selector)
+    
+    def _selector_specs(self, selector_key: str) -> List[Tuple[str, str]]:
+        """Get the configured selectors for a key as (by, selector) pairs, sent to in-page scripts as arrays"""
+        return self._resolved_selectors.get(selector_key, [])
+    
+    def _execute_page_script(self, script: str, *args):
+        """Run a script in the page with the selector helpers (findAll, findFirst) in scope"""
+        return self.driver.execute_script(self._JS_SELECTOR_HELPERS + script, *args)
+    
+    def _execute_async_page_script(self, script: str, *args):
+        """Run an asynchronous script in the page with the selector helpers in scope, the script calls the last argument when done"""
+        return self.driver.execute_async_script(self._JS_SELECTOR_HELPERS + script, *args)
     
     def _click_element(self, selector: str) -> bool:
         """Click element by selector"""
@@ -385,85 +788,116 @@ class SavageScraper(ABC):
             return ""
         
         try:
-            # Try innerText first (best for visible text)
-            text = element.get_attribute('innerText')
-            if text and text.strip():
-                return self._clean_text(text)
+            # Text of the current category elements was already fetched and cleaned by _extract_text_batch
+            text = self._prefetched_text.get(element.id)
+            if text is not None:
+                return text
             
-            # Fallback to .text
-            text = element.text
+            # innerText first (best for visible text), then textContent, then innerHTML, in one round trip
+            text = self.driver.execute_script(self._RAW_TEXT_JS, element)
             if text and text.strip():
                 return self._clean_text(text)
-            
-            # Last resort: innerHTML with HTML tags removed
-            text = element.get_attribute('innerHTML')
-            if text and text.strip():
-                # Remove HTML tags
-                text = re.sub(r'<[^>]+>', '', text)
-                return self._clean_text(text)
                 
         except Exception:
             pass
         
         return ""
     
+    def _extract_text_batch(self, elements: List[WebElement]) -> List[str]:
+        """Extract clean text from many elements with a single script call"""
+        if not elements:
+            return []
+        try:
+            texts = self.driver.execute_script(self._RAW_TEXTS_JS, elements)
+        except Exception:
+            return [self.get_clean_text(element) for element in elements]
+        return [self._clean_text(text) if text and text.strip() else "" for text in texts]
+    
     def _clean_text(self, text: str) -> str:
         """Clean up extracted text"""
         if not text:
             return ""
         # Remove HTML tags first
-        text = re.sub(r'<[^>]+>', '', text)
-        # Replace HTML entities
-        text = text.replace('&nbsp;', ' ').replace('&amp;', '&').replace('&lt;', '<').replace('&gt;', '>')
+        text = _HTML_TAG_RE.sub('', text)
+        # Replace HTML entities in a single scan
+        text = _HTML_ENTITY_RE.sub(_replace_html_entity, text)
         # Remove extra whitespace and normalize
-        text = re.sub(r'\s+', ' ', text).strip()
+        text = _WHITESPACE_RE.sub(' ', text).strip()
         
         return text
     
     def process_batch(self, items_batch: List[Dict], log_queue: mp.Queue, 
-                     output_queue: mp.Queue, progress_queue: mp.Queue):
+                     output_queue: mp.Queue, progress: 'ProgressCounters', shutdown_event=None):
         """Process a batch of items in a separate process"""
+        self._process_items(iter(items_batch), len(items_batch), log_queue, output_queue, progress, shutdown_event)
+    
+    def process_tasks(self, task_queue: mp.Queue, log_queue: mp.Queue,
+                      output_queue: mp.Queue, progress: 'ProgressCounters', items: Optional[List[Dict]] = None,
+                      shutdown_event=None):
+        """Process items pulled one at a time from a task queue shared with the other workers, until a None sentinel.
+        When items is given the queue carries indices into it instead of the items themselves."""
+        tasks = iter(task_queue.get, None)
+        if items is not None:
+            tasks = (items[index] for index in tasks)
+        self._process_items(tasks, None, log_queue, output_queue, progress, shutdown_event)
+    
+    def _process_items(self, items: Iterator[Dict], total: Optional[int], log_queue: mp.Queue,
+                       output_queue: mp.Queue, progress: 'ProgressCounters', shutdown_event=None):
+        """Process items from an iterator, total is None when they come from a shared task queue.
+        Once shutdown_event is set, the item in progress is finished and no other one is started."""
+        stop_output_timer = threading.Event()
+        output_timer = None
         try:
             # Setup logging for this process
             self.setup_process_logging(log_queue)
             
-            self.logger.info(f"Starting batch processing of {len(items_batch)} items in process {self.process_id}")
+            if shutdown_event is not None:
+                # Interrupts are handled by the main process, which asks workers to stop through shutdown_event
+                signal.signal(signal.SIGINT, signal.SIG_IGN)
+                items = self._until_shutdown(items, shutdown_event)
             
-            # Initialize driver in the worker process
-            if not self._init_driver():
-                self.logger.error("Failed to initialize WebDriver in worker process")
-                # Signal failure for each item in the batch
-                for _ in items_batch:
-                    progress_queue.put(-1)
-                return
+            if total is None:
+                self.logger.info(f"Starting to process items from the task queue in process {self.process_id}")
+            else:
+                self.logger.info(f"Starting batch processing of {total} items in process {self.process_id}")
             
-            # Process items one by one and send results
-            for i, item in enumerate(items_batch):
+            # Pin before any driver starts, chromedriver and Chrome inherit the affinity
+            if self.cpu_affinity and hasattr(os, 'sched_setaffinity'):
                 try:
-                    if not item.get(self.progress_tracking_key):
-                        self.logger.warning(f"Skipping item without {self.progress_tracking_key}: {item}")
-                        progress_queue.put(0)  # No results but item was processed
-                        continue
-                    
-                    self.logger.info(f"[{i+1}/{len(items_batch)}] Processing item in process {self.process_id}")
-                    
-                    results = self._process_single_item(item)
-                    if results:
-                        # Send each result to output queue
-                        for result in results:
-                            output_queue.put(result)
-                        
-                        # Signal progress: number of output items generated from this input item
-                        progress_queue.put(len(results))
-                        self.logger.info(f"Successfully processed item - generated {len(results)} output items")
-                    else:
-                        self.logger.warning(f"No results from item processing")
-                        progress_queue.put(0)  # No results but item was processed
-                    
-                except Exception as e:
-                    self.logger.error(f"Error processing item {item}: {e}")
-                    progress_queue.put(-1)  # Signal error for this input item
-                    continue
+                    os.sched_setaffinity(0, self.cpu_affinity)
+                except OSError as e:
+                    self.logger.warning(f"Could not pin process {self.process_id} to its NUMA node: {e}")
+            
+            # Without an output queue the worker writes its own output shard
+            if output_queue is None:
+                output_queue = OutputShard(output_shard_file(self.output_file_path, self.process_id), self.logger)
+            self._output_queue = output_queue
+            output_timer = threading.Thread(
+                target=self._send_stale_output, args=(stop_output_timer,), name='OutputTimer', daemon=True
+            )
+            output_timer.start()
+            num_drivers = max(1, self.DRIVERS_PER_PROCESS if total is None else min(self.DRIVERS_PER_PROCESS, total))
+            
+            if num_drivers == 1:
+                # Initialize driver in the worker process
+                if not self._init_driver():
+                    self.logger.error("Failed to initialize WebDriver in worker process")
+                    # Signal failure for each item of the batch, items of a task queue are left to the other workers
+                    if total is not None:
+                        for _ in items:
+                            progress.record(-1)
+                    return
+                
+                # Process items one by one and send results
+                for i, item in enumerate(items):
+                    self._process_batch_item(i, item, total, progress)
+            else:
+                # Each thread starts its own driver on its first item and keeps it for the following ones
+                self.logger.info(f"Processing with {num_drivers} drivers in process {self.process_id}")
+                next_item = self._thread_safe_next(items)
+                with ThreadPoolExecutor(max_workers=num_drivers) as executor:
+                    for _ in range(num_drivers):
+                        executor.submit(self._process_items_in_thread, next_item, total, progress)
             
             self.logger.info(f"Completed batch processing")
                 
@@ -484,20 +918,168 @@ class SavageScraper(ABC):
                 'created': time.time()
             }))
             
-            # Signal failure for any remaining items
-            for _ in items_batch:
-                progress_queue.put(-1)
+            # Signal failure for the items of the batch not processed yet
+            if total is not None:
+                for _ in items:
+                    progress.record(-1)
         finally:
-            # Clean up driver
-            if self.driver:
+            # Send the rows still pending before reporting completion
+            stop_output_timer.set()
+            if output_timer is not None:
+                # A batch the timer already took from the pending list is sent before the final flush
+                output_timer.join()
+            self._flush_output()
+            if isinstance(self._output_queue, OutputShard):
+                self._output_queue.close()
+            
+            # Clean up every driver started by this worker
+            for driver in self._drivers:
                 try:
-                    self.driver.quit()
+                    driver.quit()
                     self.logger.info("WebDriver closed successfully")
                 except Exception as e:
                     self.logger.warning(f"Error closing WebDriver: {e}")
+            self._drivers = []
             
             # Signal process completion
-            progress_queue.put('DONE')
+            progress.finish_worker(self.process_id)
+    
+    def _until_shutdown(self, items: Iterator[Dict], shutdown_event) -> Iterator[Dict]:
+        """Yield items until shutdown_event is set"""
+        for item in items:
+            if shutdown_event.is_set():
+                self.logger.info(f"Shutdown requested, process {self.process_id} stops before its next item")
+                return
+            yield item
+    
+    @staticmethod
+    def _thread_safe_next(items: Iterator[Dict]) -> Callable[[], Optional[Tuple[int, Dict]]]:
+        """Function returning (index, item) pairs from an iterator shared by several threads, None once it is exhausted"""
+        lock = threading.Lock()
+        numbered = enumerate(items)
+        
+        def next_item():
+            with lock:
+                return next(numbered, None)
+        
+        return next_item
+    
+    def _process_items_in_thread(self, next_item: Callable[[], Optional[Tuple[int, Dict]]], total: Optional[int],
+                                 progress: 'ProgressCounters') -> None:
+        """Process items on a pool thread until none are left, starting the thread's driver on its first item"""
+        for index, item in iter(next_item, None):
+            if self.driver is None and not self._init_driver():
+                self.logger.error("Failed to initialize WebDriver in worker thread, skipping item")
+                progress.record(-1)
+                continue
+            self._process_batch_item(index, item, total, progress)
+    
+    def _process_batch_item(self, index: int, item: Dict, total: Optional[int], progress: 'ProgressCounters') -> None:
+        """Process one batch item with the current driver, send its results and report progress"""
+        try:
+            if not item.get(self.progress_tracking_key):
+                self.logger.warning(f"Skipping item without {self.progress_tracking_key}: {item}")
+                progress.record(0)  # No results but item was processed
+                return
+            
+            if self._items_on_driver > 0 and not self._reset_driver_state():
+                self.logger.error("Failed to recycle WebDriver, skipping item")
+                progress.record(-1)
+                return
+            self._items_on_driver += 1
+            
+            position = f"{index+1}/{total}" if total is not None else f"{index+1}"
+            if (index + 1) % 10 == 0:
+                self.logger.info(f"[{position}] Processing item in process {self.process_id}")
+            else:
+                self.logger.debug(f"[{position}] Processing item in process {self.process_id}")
+            
+            self._item_scraped_at = datetime.now().isoformat()
+            self._emitted_count = 0
+            
+            # Results returned at the end are sent after any the scraper already streamed
+            results = self._process_single_item(item)
+            if results:
+                self._emit_results(results)
+            
+            if self._emitted_count:
+                # Signal progress: number of output items generated from this input item
+                progress.record(self._emitted_count)
+                self.logger.debug(f"Successfully processed item - generated {self._emitted_count} output items")
+            else:
+                self.logger.warning(f"No results from item processing")
+                progress.record(0)  # No results but item was processed
+            
+        except Exception as e:
+            self.logger.error(f"Error processing item {item}: {e}")
+            progress.record(-1)  # Signal error for this input item
+    
+    def _emit_results(self, results: List[Dict[str, Any]]) -> None:
+        """Stamp results with scraped_at and process_id and send them to the output writer.
+        Scrapers producing many rows per item can call this while processing instead of returning them all at once."""
+        for result in results:
+            result['scraped_at'] = self._item_scraped_at
+            result['process_id'] = self.process_id
+        self._queue_output(results)
+        self._emitted_count += len(results)
+    
+    def _queue_output(self, messages: List[Dict[str, Any]]) -> None:
+        """Add messages for the output writer, sending the pending ones as a single list when enough are waiting"""
+        with self._pending_output_lock:
+            if self._sampled_rows < self.OUTPUT_SIZE_SAMPLES:
+                self._sample_output_size(messages)
+            self._pending_output.extend(messages)
+            if (len(self._pending_output) < self._output_put_rows and
+                    time.monotonic() - self._pending_output_since < self.OUTPUT_PUT_INTERVAL):
+                return
+            pending, self._pending_output = self._pending_output, []
+            self._pending_output_since = time.monotonic()
+            # Sent under the lock, so batches taken by different threads reach the writer in the order they were taken
+            self._output_queue.put(pending)
+    
+    def _sample_output_size(self, messages: List[Dict[str, Any]]) -> None:
+        """Measure the pickled size of the first rows and derive how many rows make an OUTPUT_PUT_BYTES put"""
+        for message in messages[:self.OUTPUT_SIZE_SAMPLES - self._sampled_rows]:
+            self._sampled_bytes += len(pickle.dumps(message, protocol=pickle.HIGHEST_PROTOCOL))
+            self._sampled_rows += 1
+        if not self._sampled_rows:
+            return
+        average_bytes = max(1, self._sampled_bytes // self._sampled_rows)
+        self._output_put_rows = max(1, self.OUTPUT_PUT_BYTES // average_bytes)
+    
+    def _flush_output(self) -> None:
+        """Send every pending message to the output writer"""
+        with self._pending_output_lock:
+            pending, self._pending_output = self._pending_output, []
+            self._pending_output_since = time.monotonic()
+            if pending and self._output_queue is not None:
+                self._output_queue.put(pending)
+    
+    def _send_stale_output(self, stop: threading.Event) -> None:
+        """Send pending messages once they are OUTPUT_PUT_INTERVAL seconds old, also while the worker waits on a page"""
+        while not stop.wait(max(0.01, self._pending_output_since + self.OUTPUT_PUT_INTERVAL - time.monotonic())):
+            if time.monotonic() - self._pending_output_since >= self.OUTPUT_PUT_INTERVAL:
+                self._flush_output()
+    
+    def _empty_results(self, item: Dict[str, Any]) -> List[Dict[str, Any]]:
+        """Mark an item without results as processed, either as an empty output row or in the processed keys file"""
+        if not self.WRITE_EMPTY_RESULTS:
+            self._mark_processed(item)
+            return []
+        empty_results = [self._create_empty_result(item)]
+        if self.RESUME_FROM_PROCESSED_KEYS:
+            # The marker has to follow the row, so the row is sent here instead of being returned
+            self._emit_results(empty_results)
+            self._mark_processed(item)
+            return []
+        return empty_results
+    
+    def _mark_processed(self, item: Dict[str, Any]) -> None:
+        """Record an item in the processed keys file, after any rows it already sent"""
+        # Stored under the resume key, which is what _filter_items_for_resume looks up in the input items
+        key = item.get(self.resume_key)
+        if key and self._output_queue is not None:
+            self._queue_output([{_PROCESSED_KEY_FIELD: key}])
     
     def _process_single_item(self, item: Dict[str, Any]) -> List[Dict[str, Any]]:
         """Process a single item to extract categories"""
@@ -513,25 +1095,33 @@ class SavageScraper(ABC):
             category_elements = self._find_elements(self._get_categories_selector())
             
             if not category_elements:
-                self.logger.warning(f"No categories found, creating empty result")
-                # Create empty entry to mark as processed
-                empty_result = self._create_empty_result(item)
-                new_items.append(empty_result)
+                self.logger.warning(f"No categories found, marking item as processed")
+                new_items.extend(self._empty_results(item))
             else:
-                self.logger.info(f"Found {len(category_elements)} category elements")
-            
-                # Extract each category
-                for category_element in category_elements:
-                    try:
-                        result_item = self._process_category_element(category_element, item)
-                        if result_item:
-                            new_items.append(result_item)
-                    
-                    except Exception as e:
-                        self.logger.warning(f"Error processing category element: {e}")
-                        continue
+                self.logger.debug(f"Found {len(category_elements)} category elements")
+                
+                # Fetch the text of every category at once, get_clean_text serves it from there
+                texts = self._extract_text_batch(category_elements)
+                self._prefetched_text = {element.id: text for element, text in zip(category_elements, texts)}
+                
+                # Extract each category, with the per element calls bound once outside the loop
+                process_element = self._process_category_element
+                append = new_items.append
+                warn = self.logger.warning
+                try:
+                    for category_element in category_elements:
+                        try:
+                            result_item = process_element(category_element, item)
+                            if result_item:
+                                append(result_item)
+                        
+                        except Exception as e:
+                            warn(f"Error processing category element: {e}")
+                            continue
+                finally:
+                    self._prefetched_text = {}
             
-            self.logger.info(f"Successfully extracted {len(new_items)} categories")
+            self.logger.debug(f"Successfully extracted {len(new_items)} categories")
             return new_items
         
         except Exception as e:
@@ -539,126 +1129,216 @@ class SavageScraper(ABC):
             return []
 
 
-class QueueHandler(logging.Handler):
-    """logging handler - sends logs to a multiprocessing queue"""
-    
-    def __init__(self, log_queue):
-        super().__init__()
-        self.log_queue = log_queue
+def start_log_listener(log_queue: mp.Queue, log_file: Path) -> QueueListener:
+    """Start a listener thread in the main process that writes every queued log record to the log file and stdout"""
+    formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+    handlers = [
+        logging.FileHandler(log_file, encoding='utf-8'),
+        logging.StreamHandler(sys.stdout)
+    ]
+    for handler in handlers:
+        handler.setFormatter(formatter)
     
-    def emit(self, record):
-        try:
-            self.log_queue.put(record)
-        except Exception:
-            pass  # Ignore errors in logging
+    listener = QueueListener(log_queue, *handlers)
+    listener.start()
+    return listener
 
 
-class LoggerProcess:
-    """Process for handling all logging"""
-    
-    def __init__(self, log_queue: mp.Queue, log_file: Path):
-        self.log_queue = log_queue
-        self.log_file = log_file
-        self.should_stop = False
-    
-    def run(self):
-        """Main logger process loop"""
-        # Setup file logging
-        logging.basicConfig(
-            level=logging.INFO,
-            format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-            handlers=[
-                logging.FileHandler(self.log_file, encoding='utf-8'),
-                logging.StreamHandler(sys.stdout)
-            ]
-        )
-        logger = logging.getLogger('MainLogger')
-        
-        logger.info("Logger process started")
-        
-        while not self.should_stop:
-            try:
-                # Get log record with timeout
-                record = self.log_queue.get(timeout=1.0)
-                if record is None:  # Shutdown signal
-                    break
-                
-                # Handle the log record
-                if isinstance(record, logging.LogRecord):
-                    logger.handle(record)
-                else:
-                    logger.info(str(record))
-                    
-            except queue.Empty:
-                continue
-            except Exception as e:
-                logger.error(f"Error in logger process: {e}")
-        
-        logger.info("Logger process stopped")
-    
-    def stop(self):
-        """Signal logger to stop"""
-        self.should_stop = True
+def start_output_writer(output_queue: mp.Queue, output_file: Path,
+                        log_queue: mp.Queue) -> Tuple['OutputWriterThread', threading.Thread]:
+    """Start a thread in the main process that writes the results queued by the workers to the output file"""
+    output_writer = OutputWriterThread(output_queue, OutputManager(output_file), log_queue)
+    output_writer_thread = threading.Thread(target=output_writer.run, name='OutputWriter')
+    output_writer_thread.start()
+    return output_writer, output_writer_thread
 
 
 class OutputManager:
-    """Thread-safe output file manager"""
+    """Thread-safe output file manager (CSV, or JSON Lines when the output file ends in .jsonl).
+    Results are buffered and written in batches, at most FLUSH_EVERY rows or FLUSH_INTERVAL seconds apart."""
+    
+    FLUSH_EVERY = 50
+    FLUSH_INTERVAL = 2.0
     
-    def __init__(self, output_file: Path):
+    def __init__(self, output_file: Path, need_flock: bool = False):
         self.output_file = output_file
+        self.output_format = 'jsonl' if output_file.suffix == '.jsonl' else 'csv'
         self.lock = threading.Lock()
+        # The output writer thread is the only writer, so file locks are only taken when another process may write too
+        self._need_flock = need_flock
+        # JSON Lines output is appended through one descriptor opened with O_APPEND on first write
+        self._jsonl_fd = None
         self._ensure_file_exists()
-        self.headers_written = False
+        # CSV columns, read once from the existing header or taken from the first result written
+        self.fieldnames = self._read_csv_header() if self.output_format == 'csv' else None
+        self._buffer = []
+        # Keys of items processed without results, appended to the processed keys file
+        self.processed_keys_file = processed_keys_file(output_file)
+        self._processed_keys = []
+        self._last_flush = time.time()
     
-    def _ensure_file_exists(self):
+    def _ensure_file_exists(self) -> None:
         """Ensure output file exists"""
         if not self.output_file.exists():
             self.output_file.touch()
     
+    def _read_csv_header(self) -> Optional[List[str]]:
+        """Read the header of an existing CSV output file, None when the file is still empty"""
+        try:
+            with open(self.output_file, 'r', encoding='utf-8', newline='') as f:
+                return next(csv.reader(f), None) or None
+        except Exception:
+            return None
+    
     @contextmanager
-    def _file_lock(self, file_handle):
-        """Context manager for file locking"""
+    def _file_lock(self, file_handle) -> Iterator[None]:
+        """Context manager for file locking, a no-op unless need_flock was set"""
+        if not self._need_flock:
+            yield
+            return
+        fileno = file_handle if isinstance(file_handle, int) else file_handle.fileno()
         try:
-            fcntl.flock(file_handle.fileno(), fcntl.LOCK_EX)
+            fcntl.flock(fileno, fcntl.LOCK_EX)
             yield
         finally:
-            fcntl.flock(file_handle.fileno(), fcntl.LOCK_UN)
+            fcntl.flock(fileno, fcntl.LOCK_UN)
     
-    def append_single_result(self, result: Dict, logger: logging.Logger = None):
-        """Thread-safe append single result to output file"""
+    def close(self) -> None:
+        """Close the JSON Lines output descriptor, if one was opened"""
+        with self.lock:
+            if self._jsonl_fd is not None:
+                os.close(self._jsonl_fd)
+                self._jsonl_fd = None
+    
+    def append_single_result(self, result: Dict, logger: Optional[logging.Logger] = None) -> None:
+        """Thread-safe buffer a single result, writing the buffer out when it is full or old enough"""
+        self.append_batch([result], logger)
+    
+    def append_batch(self, results: List[Dict], logger: Optional[logging.Logger] = None) -> None:
+        """Thread-safe buffer several results under one lock, writing the buffer out when it is full or old enough"""
+        with self.lock:
+            self._buffer.extend(results)
+        
+        if len(self._buffer) >= self.FLUSH_EVERY:
+            self.flush(logger)
+        else:
+            self.flush_if_stale(logger)
+    
+    def append_messages(self, messages: List[Dict], logger: Optional[logging.Logger] = None) -> int:
+        """Buffer a batch of worker messages, results and processed key markers alike, returning the number of results"""
+        results = [message for message in messages if _PROCESSED_KEY_FIELD not in message]
+        if len(results) < len(messages):
+            self.append_processed_keys(
+                [message[_PROCESSED_KEY_FIELD] for message in messages if _PROCESSED_KEY_FIELD in message], logger
+            )
+        if results:
+            self.append_batch(results, logger)
+        return len(results)
+    
+    def append_processed_keys(self, keys: List[str], logger: Optional[logging.Logger] = None) -> None:
+        """Thread-safe buffer the keys of items processed without results"""
+        with self.lock:
+            self._processed_keys.extend(str(key) for key in keys)
+        self.flush_if_stale(logger)
+    
+    def flush(self, logger: Optional[logging.Logger] = None) -> None:
+        """Thread-safe write every buffered result to the output file"""
         log = logger or logging.getLogger('OutputManager')
         
         with self.lock:
+            self._last_flush = time.time()
+            if self._buffer:
+                results, self._buffer = self._buffer, []
+                if self.output_format == 'jsonl':
+                    self._write_jsonl(results, log)
+                else:
+                    self._write_csv(results, log)
+            # Keys go out after the rows, an item is never marked processed ahead of the rows it sent
+            if self._processed_keys:
+                keys, self._processed_keys = self._processed_keys, []
+                self._write_processed_keys(keys, log)
+    
+    def flush_if_stale(self, logger: Optional[logging.Logger] = None) -> None:
+        """Flush the buffer if it has not been written for FLUSH_INTERVAL seconds"""
+        if time.time() - self._last_flush >= self.FLUSH_INTERVAL:
+            self.flush(logger)
+    
+    def _write_csv(self, results: List[Dict], log: logging.Logger) -> None:
+        """Append results to the CSV output with a single write under the file lock"""
+        try:
+            with open(self.output_file, 'a', encoding='utf-8', newline='') as f:
+                with self._file_lock(f):
+                    # The header was read when the manager was created, a new file takes the first result's columns
+                    write_header = False
+                    if self.fieldnames is None:
+                        write_header = f.tell() == 0
+                        self.fieldnames = list(results[0].keys())
+                    
+                    writer = csv.DictWriter(f, fieldnames=self.fieldnames, restval='', extrasaction='ignore')
+                    if write_header:
+                        writer.writeheader()
+                    writer.writerows(results)
+            
+            log.debug(f"Appended {len(results)} results to output file")
+            
+        except Exception as e:
+            log.error(f"Error appending results to output file: {e}")
+            # Fallback: write to backup file
+            backup_file = self.output_file.with_suffix(f'.backup_{int(time.time())}.csv')
             try:
-                # Check if file is empty or headers not written
-                file_is_empty = self.output_file.stat().st_size == 0
-                
-                # Convert result to DataFrame
-                df_result = pd.DataFrame([result])
-                
-                # Write to file
-                with open(self.output_file, 'a', encoding='utf-8', newline='') as f:
-                    with self._file_lock(f):
-                        # Write headers if file is empty
-                        write_header = file_is_empty or not self.headers_written
-                        df_result.to_csv(f, index=False, header=write_header)
-                        self.headers_written = True
-                
-                log.debug(f"Appended single result to output file")
-                
-            except Exception as e:
-                log.error(f"Error appending single result to output file: {e}")
-                # Fallback: write to backup file
-                backup_file = self.output_file.with_suffix(f'.backup_{int(time.time())}.csv')
-                try:
-                    pd.DataFrame([result]).to_csv(backup_file, index=False, encoding='utf-8')
-                    log.warning(f"Result saved to backup file: {backup_file}")
-                except Exception as backup_e:
-                    log.error(f"Failed to save backup file: {backup_e}")
+                with open(backup_file, 'w', encoding='utf-8', newline='') as f:
+                    writer = csv.DictWriter(f, fieldnames=list(results[0].keys()), restval='', extrasaction='ignore')
+                    writer.writeheader()
+                    writer.writerows(results)
+                log.warning(f"Results saved to backup file: {backup_file}")
+            except Exception as backup_e:
+                log.error(f"Failed to save backup file: {backup_e}")
+    
+    def _write_processed_keys(self, keys: List[str], log: logging.Logger) -> None:
+        """Append keys to the processed keys file, one per line, under the file lock"""
+        try:
+            with open(self.processed_keys_file, 'a', encoding='utf-8') as f:
+                with self._file_lock(f):
+                    f.write(''.join(f"{key}\n" for key in keys))
+        except Exception as e:
+            log.error(f"Error appending processed keys: {e}")
+    
+    @staticmethod
+    def _encode_jsonl(results: List[Dict]) -> bytes:
+        """Encode results as UTF-8 JSON lines, with orjson when it is installed"""
+        if orjson is not None:
+            return b''.join(orjson.dumps(result, default=str, option=orjson.OPT_APPEND_NEWLINE) for result in results)
+        return ''.join(json.dumps(result, ensure_ascii=False, default=str) + '\n' for result in results).encode('utf-8')
+    
+    def _write_jsonl(self, results: List[Dict], log: logging.Logger) -> None:
+        """Append results as JSON lines with a single write under the file lock"""
+        lines = self._encode_jsonl(results)
+        try:
+            if self._jsonl_fd is None:
+                self._jsonl_fd = os.open(self.output_file, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+            with self._file_lock(self._jsonl_fd):
+                view = memoryview(lines)
+                while view:
+                    view = view[os.write(self._jsonl_fd, view):]
+            
+            log.debug(f"Appended {len(results)} results to output file")
+            
+        except Exception as e:
+            log.error(f"Error appending results to output file: {e}")
+            backup_file = self.output_file.with_suffix(f'.backup_{int(time.time())}.jsonl')
+            try:
+                with open(backup_file, 'wb') as f:
+                    f.write(lines)
+                log.warning(f"Results saved to backup file: {backup_file}")
+            except Exception as backup_e:
+                log.error(f"Failed to save backup file: {backup_e}")
 
 
-class OutputWriterProcess:
-    """Process for writing output in real-time"""
+class OutputWriterThread:
+    """Writer for real-time output, run on a thread of the main process next to the log listener"""
+    
+    # Most messages taken off the output queue before handing them to the output manager as one batch
+    MAX_BATCH = 200
     
     def __init__(self, output_queue: mp.Queue, output_manager: OutputManager, log_queue: mp.Queue):
         self.output_queue = output_queue
@@ -667,44 +1347,273 @@ class OutputWriterProcess:
         self.should_stop = False
         self.items_written = 0
     
-    def run(self):
-        """Main output writer process loop"""
-        # Setup logging for this process
+    def run(self) -> None:
+        """Main output writer loop"""
+        # Setup logging for this thread
         logger = logging.getLogger('OutputWriter')
         logger.addHandler(QueueHandler(self.log_queue))
         logger.setLevel(logging.INFO)
         
-        logger.info("Output writer process started")
+        logger.info("Output writer thread started")
         
         while not self.should_stop:
             try:
-                # Get result with timeout
-                result = self.output_queue.get(timeout=1.0)
-                if result is None:  # Shutdown signal
+                # Get results with timeout, workers send them as lists
+                message = self.output_queue.get(timeout=1.0)
+                if message is None:  # Shutdown signal
                     break
                 
-                # Write result immediately
-                self.output_manager.append_single_result(result, logger)
-                self.items_written += 1
-                
-                if self.items_written % 10 == 0:  # Log every 10 items
-                    logger.info(f"Written {self.items_written} items to output file")
+                # Take everything else already queued, up to MAX_BATCH messages, and buffer it as one batch
+                batch = self._results_of(message)
+                for _ in range(self.MAX_BATCH - 1):
+                    try:
+                        message = self.output_queue.get_nowait()
+                    except queue.Empty:
+                        break
+                    if message is None:  # Shutdown signal
+                        self.should_stop = True
+                        break
+                    batch.extend(self._results_of(message))
+                self._buffer_batch(batch, logger)
                     
             except queue.Empty:
-                continue
+                # Queue is idle, write out whatever is still buffered once it is old enough
+                self.output_manager.flush_if_stale(logger)
             except Exception as e:
-                logger.error(f"Error in output writer process: {e}")
+                logger.error(f"Error in output writer thread: {e}")
+        
+        self.output_manager.flush(logger)
+        self.output_manager.close()
+        logger.info(f"Output writer thread stopped. Total items written: {self.items_written}")
+    
+    @staticmethod
+    def _results_of(message) -> List[Dict]:
+        """Results carried by a queue message, a list from the workers or a single result"""
+        return message if isinstance(message, list) else [message]
+    
+    def _buffer_batch(self, batch: List[Dict], logger: logging.Logger) -> None:
+        """Hand a batch of queue messages to the output manager and log progress"""
+        written = self.output_manager.append_messages(batch, logger)
+        if not written:
+            return
+        
+        previous_written = self.items_written
+        self.items_written += written
         
-        logger.info(f"Output writer process stopped. Total items written: {self.items_written}")
+        if self.items_written // 10 > previous_written // 10:  # Log every 10 items
+            logger.info(f"Written {self.items_written} items to output file")
     
-    def stop(self):
+    def stop(self) -> None:
         """Signal output writer to stop"""
         self.should_stop = True
 
 
+class OutputShard:
+    """Output sink of a worker writing its own part of the output, used in place of the output queue"""
+    
+    def __init__(self, shard_file: Path, logger: logging.Logger):
+        self.output_manager = OutputManager(shard_file)
+        self.logger = logger
+    
+    def put(self, messages: List[Dict]) -> None:
+        """Buffer messages sent by the worker, as the output writer would"""
+        self.output_manager.append_messages(messages, self.logger)
+    
+    def close(self) -> None:
+        """Write out everything buffered and close the shard"""
+        self.output_manager.flush(self.logger)
+        self.output_manager.close()
+
+
+def merge_output_shards(output_file: Path, logger: Optional[logging.Logger] = None):
+    """Append every worker's part of the output, and its processed keys, to the output file, then delete the parts"""
+    log = logger or logging.getLogger('OutputManager')
+    # Only names output_shard_file makes, not backups or other files sharing the prefix
+    shard_name = re.compile(re.escape(output_file.stem) + r'\.part\d+' + re.escape(output_file.suffix))
+    shard_files = sorted(
+        (path for path in output_file.parent.glob(f"{output_file.stem}.part*{output_file.suffix}")
+         if shard_name.fullmatch(path.name)),
+        key=lambda path: path.name
+    )
+    if not shard_files:
+        return
+    
+    # Parts are appended to copies swapped in at the end, a failed or interrupted merge leaves the output untouched
+    # and every part in place for the next run
+    keys_file = processed_keys_file(output_file)
+    merged_file = output_file.with_name(f"{output_file.name}.merging")
+    merged_keys_file = keys_file.with_name(f"{keys_file.name}.merging")
+    try:
+        _copy_for_merge(output_file, merged_file)
+        _copy_for_merge(keys_file, merged_keys_file)
+    except Exception as e:
+        log.error(f"Error preparing the merge of output shards: {e}")
+        return
+    
+    is_csv = output_file.suffix != '.jsonl'
+    fieldnames = None
+    if is_csv:
+        with open(merged_file, 'r', encoding='utf-8', newline='') as f:
+            fieldnames = next(csv.reader(f), None) or None
+    
+    merged_shards = []
+    for shard_file in shard_files:
+        output_size = merged_file.stat().st_size
+        keys_size = merged_keys_file.stat().st_size
+        try:
+            if is_csv:
+                fieldnames, dropped = _append_csv_shard(shard_file, merged_file, fieldnames)
+            else:
+                dropped = _append_complete_lines(shard_file, merged_file)
+            if dropped:
+                log.warning(f"Dropped {dropped} incomplete records from output shard {shard_file}")
+            
+            shard_keys_file = processed_keys_file(shard_file)
+            if shard_keys_file.exists():
+                _append_complete_lines(shard_keys_file, merged_keys_file)
+            merged_shards.append(shard_file)
+        except Exception as e:
+            # Take back whatever part of this shard was appended, it is merged again on the next run
+            os.truncate(merged_file, output_size)
+            os.truncate(merged_keys_file, keys_size)
+            log.error(f"Error merging output shard {shard_file}: {e}")
+    
+    try:
+        if merged_shards:
+            # Rows first: keys replaced ahead of their rows could mark items done whose rows are lost
+            os.replace(merged_file, output_file)
+            if keys_file.exists() or merged_keys_file.stat().st_size:
+                os.replace(merged_keys_file, keys_file)
+            else:
+                merged_keys_file.unlink()
+        else:
+            merged_file.unlink()
+            merged_keys_file.unlink()
+    except Exception as e:
+        log.error(f"Error replacing output file with merged shards: {e}")
+        return
+    
+    for shard_file in merged_shards:
+        shard_keys_file = processed_keys_file(shard_file)
+        if shard_keys_file.exists():
+            shard_keys_file.unlink()
+        shard_file.unlink()
+    log.info(f"Merged {len(merged_shards)} of {len(shard_files)} output shards into {output_file}")
+
+
+def _copy_for_merge(source_file: Path, merged_file: Path) -> None:
+    """Copy a file to be merged into, ending it with a newline so an incomplete last line is not joined to the next one"""
+    if source_file.exists():
+        shutil.copyfile(source_file, merged_file)
+    else:
+        merged_file.touch()
+    if not _ends_with_newline(merged_file):
+        with open(merged_file, 'ab') as f:
+            f.write(b'\n')
+
+
+def _ends_with_newline(path: Path) -> bool:
+    """Whether a file is empty or its last line is complete"""
+    with open(path, 'rb') as f:
+        if not f.seek(0, os.SEEK_END):
+            return True
+        f.seek(-1, os.SEEK_END)
+        return f.read(1) == b'\n'
+
+
+def _append_complete_lines(source_file: Path, target_file: Path) -> int:
+    """Append the lines of a file ending with a newline, returning 1 when an incomplete last line was left out"""
+    tail = b''
+    with open(source_file, 'rb') as source, open(target_file, 'ab') as target:
+        for chunk in iter(lambda: source.read(1024 * 1024), b''):
+            chunk = tail + chunk
+            end = chunk.rfind(b'\n') + 1
+            target.write(chunk[:end])
+            tail = chunk[end:]
+    return 1 if tail else 0
+
+
+def _append_csv_shard(shard_file: Path, target_file: Path,
+                      fieldnames: Optional[List[str]]) -> Tuple[Optional[List[str]], int]:
+    """Append a CSV part under the output's columns, returning the columns and the number of incomplete rows left out"""
+    # A worker killed in the middle of a write leaves the last row without its line end, whatever column it stopped in
+    last_row_complete = _ends_with_newline(shard_file)
+    with open(shard_file, 'r', encoding='utf-8', newline='') as source, \
+            open(target_file, 'a', encoding='utf-8', newline='') as target:
+        reader = csv.DictReader(source)
+        # Parts may not have the same columns, rows are rewritten under the output's header
+        write_header = False
+        if fieldnames is None:
+            if not reader.fieldnames:
+                return None, 0
+            fieldnames = list(reader.fieldnames)
+            write_header = target.tell() == 0
+        
+        writer = csv.DictWriter(target, fieldnames=fieldnames, restval='', extrasaction='ignore')
+        if write_header:
+            writer.writeheader()
+        # Each row is written once the next one was read, so the last one can be left out
+        dropped = 0
+        previous = None
+        for row in reader:
+            if previous is not None:
+                writer.writerow(previous)
+            previous = row
+        if previous is not None:
+            if last_row_complete:
+                writer.writerow(previous)
+            else:
+                dropped += 1
+    return fieldnames, dropped
+
+
+class ProgressCounters:
+    """Progress counters shared by the workers and the main process, updated in place instead of sent over a queue"""
+    
+    def __init__(self, num_workers: int, context=mp):
+        self.num_workers = num_workers
+        # One lock for all counters, a worker updates them together
+        self.lock = context.Lock()
+        self.processed = context.RawValue('Q', 0)
+        self.failed = context.RawValue('Q', 0)
+        self.output_items = context.RawValue('Q', 0)
+        # Workers that finished, by process_id - 1, and an event set once all of them did
+        self.finished = context.RawArray('b', num_workers)
+        self.finished_count = context.RawValue('Q', 0)
+        self.done_event = context.Event()
+    
+    def record(self, count: int) -> None:
+        """Record a processed input item: its number of output items, 0 for none or -1 for a failure"""
+        with self.lock:
+            self.processed.value += 1
+            if count == -1:
+                self.failed.value += 1
+            else:
+                self.output_items.value += count
+    
+    def finish_worker(self, process_id: int) -> bool:
+        """Mark a worker as finished, once; returns False if it already was"""
+        with self.lock:
+            if self.finished[process_id - 1]:
+                return False
+            self.finished[process_id - 1] = 1
+            self.finished_count.value += 1
+            if self.finished_count.value >= self.num_workers:
+                self.done_event.set()
+            return True
+    
+    def snapshot(self) -> Tuple[int, int, int]:
+        """Current (processed, failed, output_items)"""
+        with self.lock:
+            return self.processed.value, self.failed.value, self.output_items.value
+
+
 class ProgressTracker:
     """Track and display progress across multiple processes"""
     
+    # Seconds between two progress logs
+    LOG_INTERVAL = 10
+    
     def __init__(self, total_input_items: int, logger: logging.Logger):
         self.total_input_items = total_input_items
         self.processed_input_items = 0
@@ -715,32 +1624,22 @@ class ProgressTracker:
         self.lock = threading.Lock()
         self.last_update = 0
     
-    def update(self, count: int):
-        """Update progress count"""
+    def update(self, processed: int, failed: int, output_items: int, force_log: bool = False) -> None:
+        """Update progress from a snapshot of the shared counters"""
         with self.lock:
-            if count == -1:  # Error signal
-                self.failed_items += 1
-                self.processed_input_items += 1  # Still counts as processing an input item
-            elif count == 0:  # No results found but item was processed
-                self.processed_input_items += 1
-            else:
-                self.total_output_items += count
-                self.processed_input_items += 1  # One input item was processed
+            self.processed_input_items = processed
+            self.failed_items = failed
+            self.total_output_items = output_items
             
             # Log progress every 10 seconds or on significant milestones
             current_time = time.time()
-            if (current_time - self.last_update > 10 or 
+            if (force_log or current_time - self.last_update > self.LOG_INTERVAL or 
                 self.processed_input_items >= self.total_input_items):
                 
                 self._log_progress()
                 self.last_update = current_time
     
-    def update_process_completion(self):
-        """Called when a process signals completion"""
-        # This is just for logging process completion, doesn't affect progress calculation..
-        pass
-    
-    def _log_progress(self):
+    def _log_progress(self) -> None:
         """Log current progress"""
         if self.processed_input_items == 0:
             return
@@ -772,25 +1671,82 @@ class ProgressTracker:
         )
 
 
+# Seconds between two worker liveness checks of run_multiprocess_scraper
+PROCESS_CHECK_INTERVAL = 5.0
+
+
+def _check_processes(processes: List[mp.Process], progress: ProgressCounters, logger: logging.Logger):
+    """Mark workers that exited abnormally as finished on their behalf"""
+    for i, process in enumerate(processes):
+        if process.is_alive() or process.exitcode in (None, 0):
+            continue
+        if progress.finish_worker(i + 1):
+            logger.error(f"Process {i + 1} died with exit code {process.exitcode}")
+
+
+def _process_context():
+    """Multiprocessing context for the workers: fork where available, so children inherit the imported modules
+    and their batch instead of importing selenium again and unpickling everything"""
+    if 'fork' in mp.get_all_start_methods():
+        return mp.get_context('fork')
+    return mp.get_context()
+
+
 def split_items_into_batches(items: List[Dict], num_processes: int) -> List[List[Dict]]:
     """Split items into roughly equal batches for processing"""
     if not items:
         return []
     
-    batch_size = max(1, len(items) // num_processes)
-    batches = []
-    
-    for i in range(0, len(items), batch_size):
-        batch = items[i:i + batch_size]
-        if batch:
-            batches.append(batch)
-    
-    # If we have more batches than processes, merge the last batches
-    while len(batches) > num_processes and len(batches) > 1:
-        last_batch = batches.pop()
-        batches[-1].extend(last_batch)
-    
-    return batches
+    # The first `extra` batches get one more item, so sizes differ by at most one
+    num_batches = max(1, min(num_processes, len(items)))
+    size, extra = divmod(len(items), num_batches)
+    return [
+        items[i * size + min(i, extra):(i + 1) * size + min(i + 1, extra)]
+        for i in range(num_batches)
+    ]
+
+
+def numa_node_cpus() -> List[List[int]]:
+    """CPUs of each NUMA node as listed by Linux sysfs, an empty list elsewhere"""
+    nodes = []
+    for cpulist_file in sorted(Path('/sys/devices/system/node').glob('node[0-9]*/cpulist'),
+                               key=lambda path: int(path.parent.name[4:])):
+        try:
+            cpulist = cpulist_file.read_text().strip()
+        except OSError:
+            continue
+        cpus = []
+        for part in filter(None, cpulist.split(',')):
+            first, _, last = part.partition('-')
+            cpus.extend(range(int(first), int(last or first) + 1))
+        if cpus:
+            nodes.append(cpus)
+    return nodes
+
+
+def default_num_processes(memory_per_process_mb: int = 400) -> int:
+    """Number of worker processes the machine can run: one per CPU, bounded by the available memory per Chrome instance"""
+    cpu_count = os.cpu_count() or 1
+    available_mb = _available_memory_mb()
+    if available_mb is None:
+        return cpu_count
+    return max(1, min(cpu_count, available_mb // memory_per_process_mb))
+
+
+def _available_memory_mb() -> Optional[int]:
+    """Memory available to new processes in MB, None when it cannot be read"""
+    # MemAvailable counts the reclaimable page cache, free pages alone understate it on a warm machine
+    try:
+        with open('/proc/meminfo', 'r') as f:
+            for line in f:
+                if line.startswith('MemAvailable:'):
+                    return int(line.split()[1]) // 1024
+    except (OSError, ValueError, IndexError):
+        pass
+    try:
+        return os.sysconf('SC_AVPHYS_PAGES') * os.sysconf('SC_PAGE_SIZE') // (1024 * 1024)
+    except (ValueError, OSError, AttributeError):
+        return None
 
 
 def run_multiprocess_scraper(scraper_class: Type[SavageScraper],
@@ -822,34 +1778,35 @@ def run_multiprocess_scraper(scraper_class: Type[SavageScraper],
         process_id=0
     )
     
+    # Parts left by an interrupted sharded run belong to the output before resuming from it
+    merge_output_shards(temp_scraper.output_file_path)
+    
     # Filter items for resume functionality
+    total_items = len(items_to_scrape)
     items_to_scrape = temp_scraper._filter_items_for_resume(items_to_scrape)
+    if len(items_to_scrape) < total_items:
+        print(f"Resume: Skipping {total_items - len(items_to_scrape)} already processed items")
     
     if not items_to_scrape:
         print("No new items to process after resume filtering. Exiting.")
         return
     
-    # Setup output manager
-    output_file = temp_scraper._get_output_file_path()
-    output_manager = OutputManager(output_file)
+    output_file = temp_scraper.output_file_path
+    sharded_output = scraper_class.SHARDED_OUTPUT
     
     # Setup logging
     log_file = logs_dir / f"{scraper_class.__name__.lower()}_logs.log"
-    log_queue = mp.Queue()
-    logger_process = LoggerProcess(log_queue, log_file)
-    
-    # Setup queues
-    progress_queue = mp.Queue()
-    output_queue = mp.Queue()
+    context = _process_context()
+    log_queue = context.Queue()
     
-    # Start logger process
-    logger_proc = mp.Process(target=logger_process.run)
-    logger_proc.start()
-    
-    # Start output writer process
-    output_writer = OutputWriterProcess(output_queue, output_manager, log_queue)
-    output_writer_proc = mp.Process(target=output_writer.run)
-    output_writer_proc.start()
+    # The log listener and the output writer are threads of the main process, only started once every worker was
+    # forked: a fork copies the locks those threads hold at that moment (logging handlers, output file writes) into
+    # the child, still held. Records and results queued before then wait in their queues.
+    # With sharded output the workers write their parts themselves and there is no output queue
+    output_queue = None if sharded_output else context.Queue()
+    log_listener = None
+    output_writer = None
+    output_writer_thread = None
     
     # Setup main logger
     main_logger = logging.getLogger('SavageScraper')
@@ -862,13 +1819,32 @@ def run_multiprocess_scraper(scraper_class: Type[SavageScraper],
         main_logger.info(f"Starting multiprocess scraping with {num_processes} processes")
         main_logger.info(f"Total items to process: {len(items_to_scrape)}")
         
-        # Split items into batches
-        batches = split_items_into_batches(items_to_scrape, num_processes)
-        main_logger.info(f"Split into {len(batches)} batches")
+        # Workers pull items one at a time from a shared task queue, so a slow item only holds up its own worker.
+        # The queue only carries indices into the item list every worker gets at start (inherited when forked),
+        # and one None sentinel per worker ends it once the items run out
+        num_workers = max(1, min(num_processes, len(items_to_scrape)))
+        task_queue = context.Queue()
+        for index in range(len(items_to_scrape)):
+            task_queue.put(index)
+        for _ in range(num_workers):
+            task_queue.put(None)
+        # Items still queued after an interrupt are dropped, the main process must not wait at exit to feed them
+        task_queue.cancel_join_thread()
+        main_logger.info(f"Queued {len(items_to_scrape)} items for {num_workers} workers")
+        
+        # Workers count their progress in shared counters, the main process reads them
+        progress = ProgressCounters(num_workers, context)
+        # Set on interrupt, workers finish their current item and stop
+        shutdown_event = context.Event()
+        
+        # On NUMA hosts, spread workers over the nodes so each Chrome instance stays on one node's memory
+        numa_nodes = numa_node_cpus()
+        if len(numa_nodes) < 2:
+            numa_nodes = []
         
         # Start worker processes
         processes = []
-        for i, batch in enumerate(batches):
+        for i in range(num_workers):
             scraper_instance = scraper_class(
                 config_dir=config_dir,
                 output_dir=output_dir,
@@ -877,73 +1853,71 @@ def run_multiprocess_scraper(scraper_class: Type[SavageScraper],
                 translation=translation,
                 process_id=i + 1
             )
+            if numa_nodes:
+                scraper_instance.cpu_affinity = numa_nodes[i % len(numa_nodes)]
             
-            process = mp.Process(
-                target=scraper_instance.process_batch,
-                args=(batch, log_queue, output_queue, progress_queue)
+            process = context.Process(
+                target=scraper_instance.process_tasks,
+                args=(task_queue, log_queue, output_queue, progress, items_to_scrape, shutdown_event)
             )
             processes.append(process)
             process.start()
-            main_logger.info(f"Started process {i + 1} with {len(batch)} items")
+            main_logger.info(f"Started process {i + 1}")
         
-        # Monitor progress
-        completed_processes = 0
-        while completed_processes < len(processes):
-            try:
-                # Check for progress updates
-                try:
-                    progress_update = progress_queue.get(timeout=1.0)
-                    if progress_update == 'DONE':
-                        completed_processes += 1
-                        main_logger.info(f"Process completed ({completed_processes}/{len(processes)})")
-                        progress_tracker.update_process_completion()
-                    elif isinstance(progress_update, int):
-                        progress_tracker.update(progress_update)
-                except queue.Empty:
-                    pass
-                
-                # Check if any processes have died
-                for i, process in enumerate(processes):
-                    if not process.is_alive() and process.exitcode is not None:
-                        if process.exitcode != 0:
-                            main_logger.error(f"Process {i + 1} died with exit code {process.exitcode}")
+        log_listener = start_log_listener(log_queue, log_file)
+        if output_queue is not None:
+            output_writer, output_writer_thread = start_output_writer(output_queue, output_file, log_queue)
+        
+        # Sleep until every worker finished. Each wake-up in between refreshes the tracker from the shared counters
+        # and marks dead workers as finished, so a crash can't keep the event from being set
+        try:
+            while not progress.done_event.wait(timeout=PROCESS_CHECK_INTERVAL):
+                progress_tracker.update(*progress.snapshot())
+                _check_processes(processes, progress, main_logger)
                 
-            except KeyboardInterrupt:
-                main_logger.warning("Received interrupt signal, shutting down processes...")
-                break
-        
-        # Wait for all processes to complete
-        for i, process in enumerate(processes):
-            process.join(timeout=30)
-            if process.is_alive():
-                main_logger.warning(f"Force terminating process {i + 1}")
-                process.terminate()
-                process.join(timeout=5)
+        except KeyboardInterrupt:
+            main_logger.warning("Received interrupt signal, letting workers finish their current item...")
+            shutdown_event.set()
+        
+        # Wait for all processes to complete, they close their drivers and send their pending output themselves.
+        # Only a second interrupt terminates the ones still running
+        try:
+            for process in processes:
+                process.join()
+        except KeyboardInterrupt:
+            for i, process in enumerate(processes):
                 if process.is_alive():
-                    main_logger.error(f"Force killing process {i + 1}")
-                    process.kill()
+                    main_logger.warning(f"Force terminating process {i + 1}")
+                    process.terminate()
+                    process.join(timeout=5)
         
         main_logger.info("All processes completed")
-        progress_tracker._log_progress()  # Final progress log
+        progress_tracker.update(*progress.snapshot(), force_log=True)  # Final progress log
         
     except Exception as e:
         main_logger.error(f"Error in multiprocess scraping: {e}")
     finally:
-        # Cleanup output writer
-        output_writer.stop()
-        output_queue.put(None)  # Signal output writer to stop
-        output_writer_proc.join(timeout=5)
-        if output_writer_proc.is_alive():
-            output_writer_proc.terminate()
-        
-        # Cleanup logger
-        logger_process.stop()
-        log_queue.put(None)  # Signal logger to stop
-        logger_proc.join(timeout=5)
-        if logger_proc.is_alive():
-            logger_proc.terminate()
+        # A failure while starting the workers gets here before the threads were started, they still drain the queues
+        if log_listener is None:
+            log_listener = start_log_listener(log_queue, log_file)
+        if output_queue is not None and output_writer_thread is None:
+            output_writer, output_writer_thread = start_output_writer(output_queue, output_file, log_queue)
+        
+        # Cleanup output writer, the shutdown signal comes after every queued result so they are all written first
+        if output_writer_thread is not None:
+            output_queue.put(None)
+            output_writer_thread.join(timeout=30)
+            if output_writer_thread.is_alive():
+                main_logger.warning("Output writer still busy, stopping it after its current batch")
+                output_writer.stop()
+                output_writer_thread.join()
+        else:
+            merge_output_shards(output_file, main_logger)
         
         main_logger.info("Scraping completed")
+        
+        # Cleanup logger, handling every record still queued
+        log_listener.stop()
 
 
 def setup_signal_handlers():
@@ -0,0 +1,143 @@
+"""Products scraper: the HTTP fast path and the Selenium path produce the same output rows"""
+
+import importlib.util
+import json
+import sys
+import unittest
+from pathlib import Path
+from unittest import mock
+
+ROOT = Path(__file__).resolve().parent.parent
+
+try:
+    import lxml.html
+    # The examples import the scraper module as .SavageScraper, it is module.py in this repository
+    spec = importlib.util.spec_from_file_location('examples.SavageScraper', ROOT / 'module.py')
+    savage_scraper = importlib.util.module_from_spec(spec)
+    sys.modules['examples.SavageScraper'] = savage_scraper
+    spec.loader.exec_module(savage_scraper)
+    sys.path.insert(0, str(ROOT))
+    from examples.Products import ProductsScraper
+except ImportError as e:
+    ProductsScraper = None
+    IMPORT_ERROR = str(e)
+else:
+    IMPORT_ERROR = ''
+
+
+PRODUCT_HTML = """
+<html><body>
+  <div id="ready"></div>
+  <h1 id="name">
+    Steel   water
+    bottle&nbsp;750&#160;ml
+  </h1>
+  <img id="image" src="https://example.com/bottle.jpg">
+  <span id="rating"> 4.5 out of&nbsp;5 </span>
+  <span id="price">
+    <span>12,99</span>&nbsp;&euro;
+  </span>
+  <span id="reviews">1&#8239;234 ratings</span>
+  <a id="seller">  Acme
+     Store </a>
+  <span id="sender">Amazon</span>
+  <span id="sales"> 1K+ bought in past month </span>
+  <div id="tags"><span>Best</span> <span>Seller</span></div>
+  <table id="meta1">
+    <tr><th> Brand </th><td>&nbsp;Acme&nbsp;</td></tr>
+    <tr><th>Empty</th><td>  </td></tr>
+  </table>
+  <table id="meta2"><tr><td>Capacity</td><td>750
+    ml</td></tr></table>
+</body></html>
+"""
+
+SELECTORS = {
+    'product_ready': '#ready',
+    'product_name': '#name',
+    'product_image': '#image',
+    'product_rating': '#rating',
+    'product_price': '#price',
+    'product_reviews': '#reviews',
+    'product_seller': '#seller',
+    'product_sender': '#sender',
+    'product_sales': '#sales',
+    'product_tags': '#tags',
+    'product_metadata1': '#meta1',
+    'product_metadata2': '#meta2',
+    'product_metadata3': '#meta3',
+}
+
+ITEM = {
+    'N1': 'Home', 'N2': 'Kitchen', 'N3': 'Drinkware', 'N4': 'Bottles', 'N5': 'Steel',
+    'N3_url': 'https://example.com/n3', 'N4_url': 'https://example.com/n4', 'N5_url': 'https://example.com/n5',
+    'product_url': 'https://example.com/product', 'page': 1, 'position_in_page': 3,
+}
+
+
+def page_script_result(html: str) -> str:
+    """What _EXTRACT_PRODUCT_JS returns for the page: textContent of every field and raw rows of the tables"""
+    tree = lxml.html.fromstring(html)
+
+    def first(key):
+        found = tree.cssselect(SELECTORS[key])
+        return found[0] if found else None
+
+    def text(el):
+        return el.text_content() if el is not None else ''
+
+    def table_rows(el):
+        if el is None:
+            return []
+        return [[text(cells[0]), text(cells[1])] for cells in
+                (row.cssselect('th, td') for row in el.cssselect('tr')) if len(cells) >= 2]
+
+    fields = {field: text(first(f'product_{field}'))
+              for field in ('name', 'rating', 'price', 'reviews', 'seller', 'sender', 'sales', 'tags')}
+    fields['image'] = first('product_image').get('src')
+    fields.update({field: table_rows(first(f'product_{field}')) for field in ('metadata1', 'metadata2', 'metadata3')})
+    return json.dumps(fields)
+
+
+@unittest.skipIf(ProductsScraper is None, f"Products scraper dependencies missing: {IMPORT_ERROR}")
+class ProductExtractionPathsTest(unittest.TestCase):
+
+    def setUp(self):
+        # Only the state the extraction paths use, without configuration files or a browser
+        self.scraper = ProductsScraper.__new__(ProductsScraper)
+        self.scraper.logger = savage_scraper._NOOP_LOGGER
+        self.scraper.translation = False
+        self.scraper.page_ready_selector = 'product_ready'
+        self.scraper._tree_selectors = {}
+        self.scraper._resolved_selectors = {key: [('css', selector)] for key, selector in SELECTORS.items()}
+
+    def _http_row(self):
+        response = mock.MagicMock()
+        response.__enter__.return_value = response
+        response.read.return_value = PRODUCT_HTML.encode('utf-8')
+        response.geturl.return_value = ITEM['product_url']
+        with mock.patch('urllib.request.urlopen', return_value=response):
+            return self.scraper._extract_product_data_http(ITEM)
+
+    def _selenium_row(self):
+        with mock.patch.object(self.scraper, '_execute_page_script', return_value=page_script_result(PRODUCT_HTML)):
+            return self.scraper._extract_product_data(ITEM)
+
+    def test_both_paths_produce_the_same_row(self):
+        self.assertEqual(self._http_row(), self._selenium_row())
+
+    def test_text_is_normalized(self):
+        row = self._selenium_row()
+        self.assertEqual(row['name'], 'Steel water bottle 750 ml')
+        self.assertEqual(row['rating'], '4.5 out of 5')
+        self.assertEqual(row['price'], '12,99 €')
+        self.assertEqual(row['seller'], 'Acme Store')
+        self.assertEqual(row['tags'], 'Best Seller')
+        self.assertEqual(json.loads(row['metadata1']), {'Brand': 'Acme'})
+        self.assertEqual(json.loads(row['metadata2']), {'Capacity': '750 ml'})
+        self.assertEqual(row['metadata3'], '{}')
+        self.assertEqual(list(row), list(ProductsScraper._EMPTY_RESULT_SKELETON))
+
+
+if __name__ == '__main__':
+    unittest.main()